@@ -1,12 +1,25 @@
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, scrolledtext, messagebox, filedialog, simpledialog
 from abc import ABC, abstractmethod
+from collections import Counter
+from itertools import zip_longest
+import bisect
 import random
 import json
+import time
 from copy import deepcopy
 import os
 from datetime import datetime
 
+# Prefixes that mark continuation lines of an event block in the turn log
+# (single startswith(tuple) check instead of a chain of calls per line)
+_EVENT_DETAIL_PREFIXES = ("Consumed:", "Produced:", "Degraded:", "- ", "+ ", "  ")
+
+# Choices offered by the entity editor comboboxes
+LOCATIONS = ('extracellular', 'cytoplasm', 'endosome', 'nucleus', 'membrane', 'unknown')
+ENTITY_CLASSES = ('virion', 'protein', 'RNA', 'DNA', 'complex', 'unknown')
+
 
 # Gene Database Management System
 # Gene Database Management System
@@ -39,6 +52,28 @@ class GeneDatabaseManager:
         }
         self.file_path = None
         self.is_modified = False
+        # Lazy caches of sorted names/ids; None means rebuild on next use
+        self._sorted_entity_names = None
+        self._sorted_gene_names = None
+        self._sorted_milestone_ids = None
+        # Entity mutation counter plus version-tagged entity-class cache
+        self._entity_mutations = 0
+        # Gene/milestone counters let the editor skip refreshes when the
+        # underlying collection hasn't changed since the last redraw
+        self._gene_mutations = 0
+        self._milestone_mutations = 0
+        self._entity_classes_cache = None
+        self._entity_classes_version = -1
+        # Reverse index entity name -> gene names referencing it; None
+        # means rebuild on next use (gene edits drop it)
+        self._entity_to_genes = None
+        # Version-tagged starter/polymerase caches, same scheme as above
+        self._starter_entities_cache = None
+        self._starter_entities_version = -1
+        self._polymerase_genes_cache = None
+        self._polymerase_genes_version = -1
+        self._gene_name_set_cache = None
+        self._gene_name_set_version = -1
 
     def load_database(self, file_path):
         """Load database from JSON file"""
@@ -53,6 +88,13 @@ class GeneDatabaseManager:
             self.database = loaded_data
             self.file_path = file_path
             self.is_modified = False
+            self._sorted_entity_names = None
+            self._sorted_gene_names = None
+            self._sorted_milestone_ids = None
+            self._entity_to_genes = None
+            self._entity_mutations += 1
+            self._gene_mutations += 1
+            self._milestone_mutations += 1
             self._ensure_base_entity()
             self._ensure_milestones_section()  # Ensure milestones exist
             self._migrate_genes_add_polymerase_field(loaded_data)  # NEW: Migrate genes for polymerase support
@@ -195,6 +237,8 @@ class GeneDatabaseManager:
         """Ensure the base entity exists"""
         base_entity_name = "unenveloped virion (extracellular)"
         if base_entity_name not in self.database["entities"]:
+            self._sorted_entity_names = None
+            self._entity_mutations += 1
             self.database["entities"][base_entity_name] = {
                 "name": base_entity_name,
                 "description": "Basic viral particle outside the cell",
@@ -211,13 +255,22 @@ class GeneDatabaseManager:
         if "is_starter" not in entity_data:
             entity_data["is_starter"] = False
 
+        # Keep the sorted-name cache current (updates replace in place)
+        if self._sorted_entity_names is not None and entity_name not in self.database["entities"]:
+            bisect.insort(self._sorted_entity_names, entity_name)
+
         self.database["entities"][entity_name] = entity_data.copy()
+        self._entity_mutations += 1
         self.is_modified = True
 
     def delete_entity(self, entity_name):
         """Delete an entity"""
         if entity_name in self.database["entities"]:
             del self.database["entities"][entity_name]
+            if self._sorted_entity_names is not None:
+                index = bisect.bisect_left(self._sorted_entity_names, entity_name)
+                self._sorted_entity_names.pop(index)
+            self._entity_mutations += 1
             self.is_modified = True
 
     def get_entity(self, entity_name):
@@ -228,17 +281,33 @@ class GeneDatabaseManager:
         """Get all entity names"""
         return list(self.database["entities"].keys())
 
+    def get_all_entities(self):
+        """Get the entity table as a dict (bulk accessor for list refreshes)"""
+        return self.database["entities"]
+
+    def get_sorted_entity_names(self):
+        """Entity names in sorted order, cached between mutations.
+
+        add_entity/delete_entity keep the cache current with a bisect
+        insert/remove; bulk changes (load, sample creation, gene-driven
+        autogeneration) just drop it and the next call rebuilds.
+        """
+        if self._sorted_entity_names is None:
+            self._sorted_entity_names = sorted(self.database["entities"])
+        return self._sorted_entity_names
+
     def get_entities(self):
         """Get all entities as a dict"""
         return self.database["entities"].copy()
 
     def get_starter_entities(self):
-        """Get all entities marked as starter entities"""
-        starter_entities = []
-        for entity_name, entity_data in self.database["entities"].items():
-            if entity_data.get("is_starter", False):
-                starter_entities.append(entity_name)
-        return starter_entities
+        """Get all entities marked as starter entities (cached between mutations)"""
+        if self._starter_entities_version != self._entity_mutations:
+            self._starter_entities_cache = [
+                entity_name for entity_name, entity_data in self.database["entities"].items()
+                if entity_data.get("is_starter", False)]
+            self._starter_entities_version = self._entity_mutations
+        return self._starter_entities_cache
 
     def get_starter_entity_names(self):
         """Get names of all starter entities (alias for compatibility)"""
@@ -248,6 +317,7 @@ class GeneDatabaseManager:
         """Set the starter status of an entity"""
         if entity_name in self.database["entities"]:
             self.database["entities"][entity_name]["is_starter"] = bool(is_starter)
+            self._entity_mutations += 1
             self.is_modified = True
             return True
         return False
@@ -260,7 +330,13 @@ class GeneDatabaseManager:
         if "is_polymerase" not in gene_data:
             gene_data["is_polymerase"] = False
 
+        # Keep the sorted-name cache current (updates replace in place)
+        if self._sorted_gene_names is not None and gene_name not in self.database["genes"]:
+            bisect.insort(self._sorted_gene_names, gene_name)
+
         self.database["genes"][gene_name] = gene_data.copy()
+        self._entity_to_genes = None  # Updates may change referenced entities
+        self._gene_mutations += 1
         self._update_entities_from_genes()
         self.is_modified = True
 
@@ -268,9 +344,30 @@ class GeneDatabaseManager:
         """Delete a gene"""
         if gene_name in self.database["genes"]:
             del self.database["genes"][gene_name]
+            if self._sorted_gene_names is not None:
+                index = bisect.bisect_left(self._sorted_gene_names, gene_name)
+                self._sorted_gene_names.pop(index)
+            self._entity_to_genes = None
+            self._gene_mutations += 1
             self._update_entities_from_genes()
             self.is_modified = True
 
+    def update_gene_effects(self, gene_name, effects):
+        """Replace a gene's effects in place.
+
+        Skips add_gene's dict copy while keeping the bookkeeping the editor
+        relies on: referenced-entity autogeneration, cache invalidation and
+        the modified flag.
+        """
+        gene = self.database["genes"].get(gene_name)
+        if gene is None:
+            return
+        gene["effects"] = effects
+        self._entity_to_genes = None
+        self._gene_mutations += 1
+        self._update_entities_from_genes()
+        self.is_modified = True
+
     def get_gene(self, gene_name):
         """Get a gene by name"""
         gene_data = self.database["genes"].get(gene_name)
@@ -283,13 +380,54 @@ class GeneDatabaseManager:
         """Get all gene names"""
         return list(self.database["genes"].keys())
 
+    def get_all_genes_set(self):
+        """All gene names as a frozenset (cached between mutations)"""
+        if self._gene_name_set_version != self._gene_mutations:
+            self._gene_name_set_cache = frozenset(self.database["genes"])
+            self._gene_name_set_version = self._gene_mutations
+        return self._gene_name_set_cache
+
+    def get_sorted_gene_names(self):
+        """Gene names in sorted order, cached between mutations"""
+        if self._sorted_gene_names is None:
+            self._sorted_gene_names = sorted(self.database["genes"])
+        return self._sorted_gene_names
+
     def get_polymerase_genes(self):
-        """Get all genes marked as polymerase genes - NEW METHOD"""
-        polymerase_genes = []
-        for gene_name, gene_data in self.database["genes"].items():
-            if gene_data.get("is_polymerase", False):
-                polymerase_genes.append(gene_name)
-        return polymerase_genes
+        """Get all genes marked as polymerase genes (cached between mutations)"""
+        if self._polymerase_genes_version != self._gene_mutations:
+            self._polymerase_genes_cache = [
+                gene_name for gene_name, gene_data in self.database["genes"].items()
+                if gene_data.get("is_polymerase", False)]
+            self._polymerase_genes_version = self._gene_mutations
+        return self._polymerase_genes_cache
+
+    def get_genes_referencing_entity(self, entity_name):
+        """Gene names whose effects reference the given entity.
+
+        Backed by a reverse index built once per gene-table state, so
+        delete_entity's used-in check is a dict lookup instead of a walk
+        over every gene, effect and transition spec.
+        """
+        if self._entity_to_genes is None:
+            index = {}
+            for gene_name, gene_data in self.database["genes"].items():
+                for referenced in self._entities_referenced_by(gene_data):
+                    index.setdefault(referenced, set()).add(gene_name)
+            self._entity_to_genes = index
+        return self._entity_to_genes.get(entity_name, set())
+
+    @staticmethod
+    def _entities_referenced_by(gene_data):
+        """Yield entity names appearing in a gene's effects"""
+        for effect in gene_data.get("effects", []):
+            if effect.get("type") == "enable_entity" and effect.get("entity"):
+                yield effect["entity"]
+            rule = effect.get("rule", {})
+            for input_spec in rule.get("inputs", []):
+                yield input_spec["entity"]
+            for output_spec in rule.get("outputs", []):
+                yield output_spec["entity"]
 
     def is_polymerase_gene(self, gene_name):
         """Check if a gene is marked as a polymerase gene - NEW METHOD"""
@@ -317,6 +455,8 @@ class GeneDatabaseManager:
         # Add any missing entities as basic entities
         for entity_name in referenced_entities:
             if entity_name not in self.database["entities"]:
+                self._sorted_entity_names = None
+                self._entity_mutations += 1
                 self.database["entities"][entity_name] = {
                     "name": entity_name,
                     "description": f"Auto-generated entity: {entity_name}",
@@ -331,13 +471,22 @@ class GeneDatabaseManager:
     def add_milestone(self, milestone_data):
         """Add or update a milestone"""
         milestone_id = milestone_data["id"]
+        # Keep the sorted-id cache current (updates replace in place)
+        if self._sorted_milestone_ids is not None and milestone_id not in self.database["milestones"]:
+            bisect.insort(self._sorted_milestone_ids, milestone_id)
+
         self.database["milestones"][milestone_id] = milestone_data.copy()
+        self._milestone_mutations += 1
         self.is_modified = True
 
     def delete_milestone(self, milestone_id):
         """Delete a milestone"""
         if milestone_id in self.database["milestones"]:
             del self.database["milestones"][milestone_id]
+            if self._sorted_milestone_ids is not None:
+                index = bisect.bisect_left(self._sorted_milestone_ids, milestone_id)
+                self._sorted_milestone_ids.pop(index)
+            self._milestone_mutations += 1
             self.is_modified = True
 
     def get_milestone(self, milestone_id):
@@ -348,18 +497,33 @@ class GeneDatabaseManager:
         """Get all milestone IDs"""
         return list(self.database["milestones"].keys())
 
+    def get_sorted_milestone_ids(self):
+        """Milestone IDs in sorted order, cached between mutations"""
+        if self._sorted_milestone_ids is None:
+            self._sorted_milestone_ids = sorted(self.database["milestones"])
+        return self._sorted_milestone_ids
+
     def get_milestones(self):
         """Get all milestones as a dict"""
         return self.database["milestones"].copy()
 
     def get_entity_classes(self):
-        """Get all unique entity classes defined in the database"""
-        classes = set()
-        for entity_data in self.database["entities"].values():
-            entity_class = entity_data.get("entity_class", "unknown")
-            if entity_class:
-                classes.add(entity_class)
-        return sorted(list(classes))
+        """Get all unique entity classes defined in the database.
+
+        Cached against the entity mutation counter, so repeat calls (the
+        milestone type combobox hits this on every type change) cost a
+        version check instead of a full entity scan.
+        """
+        if self._entity_classes_version == self._entity_mutations:
+            return self._entity_classes_cache
+
+        classes = {entity_data.get("entity_class", "unknown")
+                   for entity_data in self.database["entities"].values()}
+        classes.discard("")
+        classes.discard(None)
+        self._entity_classes_cache = sorted(classes)
+        self._entity_classes_version = self._entity_mutations
+        return self._entity_classes_cache
 
     def validate_milestone_data(self, milestone_data):
         """Validate milestone data structure and values"""
@@ -409,6 +573,13 @@ class GeneDatabaseManager:
 
     def create_sample_database(self):
         """Create a sample database with a few example genes and milestones - UPDATED TO REMOVE PRODUCTION AND ADD POLYMERASE FLAGS"""
+        self._sorted_entity_names = None
+        self._sorted_gene_names = None
+        self._sorted_milestone_ids = None
+        self._entity_to_genes = None
+        self._entity_mutations += 1
+        self._gene_mutations += 1
+        self._milestone_mutations += 1
         self.database = {
             "database_info": {
                 "name": "Sample Virus Gene Database",
@@ -884,6 +1055,10 @@ class ViralSimulation:
         # NEW: Interferon system
         self.interferon_level = 0.0  # Float with 2 decimal precision, starts at 0
 
+        # Change flags so the UI can skip redraws on quiet turns
+        self.entities_changed = True
+        self.interferon_changed = True
+
     def process_turn(self):
         """Process one simulation turn - UPDATED WITH INTERFERON DECAY"""
         self.turn_count += 1
@@ -926,12 +1101,17 @@ class ViralSimulation:
                         del working_entities[entity_name]
 
         # NEW: Apply interferon decay (decrease by 1.0 per turn)
+        interferon_before = self.interferon_level
         self.interferon_level = max(0.0, self.interferon_level - 1.0)
 
         # NEW: Add interferon generated this turn (cap at 100.0)
         if interferon_added_this_turn > 0:
             self.interferon_level = min(100.0, self.interferon_level + interferon_added_this_turn)
 
+        # Record whether anything actually moved, so displays can skip quiet turns
+        self.entities_changed = bool(changes)
+        self.interferon_changed = self.interferon_level != interferon_before
+
         # Apply all changes at once (including degradation)
         self.apply_all_changes(changes)
 
@@ -998,7 +1178,6 @@ class ViralSimulation:
 
     def apply_degradation(self, entity_state):
         """Apply degradation to entities based on their degradation rates AND interferon levels"""
-        import random
         degradation_changes = []
 
         for entity_name, count in entity_state.items():
@@ -2075,12 +2254,13 @@ class BuilderModule(GameModule):
 
     def update_virus_display(self):
         """Refresh selected genes, capabilities, EP label, and rounds counter."""
-        # Selected genes list
+        # Selected genes list (single varargs insert)
         self.selected_genes_list.delete(0, tk.END)
-        if self.virus_builder:
-            for gene in self.virus_builder.selected_genes:
-                # VirusBuilder stores dicts like {"name": "..."} in many versions
-                self.selected_genes_list.insert(tk.END, gene["name"] if isinstance(gene, dict) else str(gene))
+        if self.virus_builder and self.virus_builder.selected_genes:
+            # VirusBuilder stores dicts like {"name": "..."} in many versions
+            rows = [gene["name"] if isinstance(gene, dict) else str(gene)
+                    for gene in self.virus_builder.selected_genes]
+            self.selected_genes_list.insert(tk.END, *rows)
 
         # Update details display based on current mode
         if self.current_display_mode == "virus":
@@ -2219,14 +2399,19 @@ class BuilderModule(GameModule):
                 continue
             available.append(name)
 
-        self.available_genes_list.delete(0, tk.END)
+        rows = []
         for name in available:
             cost = 0
             if self.db_manager:
                 g = self.db_manager.get_gene(name)
                 if g:
                     cost = g.get("cost", 0)
-            self.available_genes_list.insert(tk.END, f"{name} ({cost})")
+            rows.append(f"{name} ({cost})")
+
+        # One varargs insert instead of a Tcl roundtrip per row
+        self.available_genes_list.delete(0, tk.END)
+        if rows:
+            self.available_genes_list.insert(tk.END, *rows)
 
     def add_gene(self):
         """Add the selected gene - UPDATED to validate before spending EP (polymerase-safe)"""
@@ -2322,8 +2507,7 @@ class BuilderModule(GameModule):
             return
 
         # Track installed genes in game state (deck-building record)
-        if gene_name not in self.game_state.installed_genes:
-            self.game_state.installed_genes.append(gene_name)
+        self.game_state.track_installed_gene(gene_name)
 
         self.update_virus_display()
 
@@ -2365,8 +2549,7 @@ class BuilderModule(GameModule):
 
         self.virus_builder.remove_gene(gene_name)
 
-        if gene_name in self.game_state.installed_genes:
-            self.game_state.installed_genes.remove(gene_name)
+        self.game_state.untrack_installed_gene(gene_name)
 
         self.update_virus_display()
 
@@ -2390,8 +2573,8 @@ class BuilderModule(GameModule):
                 break
 
             self.virus_builder.remove_gene(gene_name)
-            if self.game_state and gene_name in self.game_state.installed_genes:
-                self.game_state.installed_genes.remove(gene_name)
+            if self.game_state:
+                self.game_state.untrack_installed_gene(gene_name)
 
 
         self.update_virus_display()
@@ -2852,6 +3035,25 @@ class PlayModule(GameModule):
             x, y = points[i], points[i + 1]
             canvas.create_oval(x - 3, y - 3, x + 3, y + 3, fill=color, outline="white", width=1)
 
+    def _make_modal_dialog(self, title, width, height):
+        """Create a centered modal Toplevel for this module.
+
+        Shared by the victory/extinction/milestone/genes dialogs. Centering
+        is computed straight from the screen dimensions, so no
+        update_idletasks() flush is needed before placing the window.
+        """
+        dialog = tk.Toplevel(self.frame)
+        dialog.title(title)
+        dialog.transient(self.frame)
+        dialog.grab_set()
+        screen_w, screen_h = self.controller.screen_size
+        x = (screen_w // 2) - (width // 2)
+        y = (screen_h // 2) - (height // 2)
+        dialog.geometry(f"{width}x{height}+{x}+{y}")
+        dialog.focus_set()
+        dialog.bind('<Escape>', lambda e: dialog.destroy())
+        return dialog
+
     def show_genes_dialog(self):
         """Show dialog with installed genes for this simulation"""
         if not hasattr(self, 'virus_blueprint'):
@@ -2864,17 +3066,7 @@ class PlayModule(GameModule):
             return
 
         # Create dialog
-        dialog = tk.Toplevel(self.frame)
-        dialog.title("Installed Genes")
-        dialog.geometry("500x400")
-        dialog.transient(self.frame)
-        dialog.grab_set()
-
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (250)
-        y = (dialog.winfo_screenheight() // 2) - (200)
-        dialog.geometry(f"500x400+{x}+{y}")
+        dialog = self._make_modal_dialog("Installed Genes", 500, 400)
 
         # Header
         header_frame = ttk.Frame(dialog)
@@ -2924,10 +3116,6 @@ class PlayModule(GameModule):
 
         ttk.Button(button_frame, text="Close", command=dialog.destroy).pack()
 
-        # Auto-focus and handle escape key
-        dialog.focus_set()
-        dialog.bind('<Escape>', lambda e: dialog.destroy())
-
     # Update the existing update_entities_display method to use the new graph
     def update_entities_display(self, entities):
         """Update entity display using the new line graph"""
@@ -3009,50 +3197,63 @@ class PlayModule(GameModule):
 
     def _process_single_turn_fast(self):
         """Process a single turn quickly (for multi-turn advancement) - no delays"""
+        # Bind the hot attribute chains once (this runs for every batch step)
+        sim = self.simulation
+        game_state = self.game_state
+
         # Process the turn
-        turn_log = self.simulation.process_turn()
+        turn_log = sim.process_turn()
+        entities = sim.entities
 
         # Extract entities created this turn from changes
         entities_created_this_turn = self._extract_entities_created(turn_log)
 
-        # Update turn label and interferon display
-        self.turn_label.config(text=f"Turn: {self.simulation.turn_count}")
-        self.update_interferon_display()
+        # Update turn label and interferon display (skip when nothing moved)
+        self.turn_label.config(text=f"Turn: {sim.turn_count}")
+        if sim.interferon_changed:
+            self.update_interferon_display()
 
         # Update milestone tracking
-        if self.game_state:
-            self.game_state.update_turn_count(self.simulation.turn_count)
-            self.game_state.update_entity_counts(self.simulation.entities, entities_created_this_turn)
+        if game_state:
+            game_state.update_turn_count(sim.turn_count)
+            game_state.update_entity_counts(entities, entities_created_this_turn)
 
         # Add log to console (full output, same as single turn, but all at once)
-        for message in turn_log:
-            self.add_console_message(message)
+        self.add_console_messages(turn_log)
 
-        # Update displays - now uses the new graph
-        self.update_entities_display(self.simulation.entities)
+        # Update displays - now uses the new graph (skip redraw on quiet turns)
+        if sim.entities_changed:
+            self.update_entities_display(entities)
 
     def _process_single_turn_dramatic(self):
         """Process a single turn with dramatic timing - shows events gradually"""
+        # Bind the hot attribute chains once (this runs on every Next Turn click)
+        sim = self.simulation
+        game_state = self.game_state
+
         # Process the turn
-        turn_log = self.simulation.process_turn()
+        turn_log = sim.process_turn()
+        entities = sim.entities
 
         # Extract entities created this turn from changes
         entities_created_this_turn = self._extract_entities_created(turn_log)
 
-        # Update turn label and interferon display
-        self.turn_label.config(text=f"Turn: {self.simulation.turn_count}")
-        self.update_interferon_display()
+        # Update turn label and interferon display (skip when nothing moved)
+        self.turn_label.config(text=f"Turn: {sim.turn_count}")
+        if sim.interferon_changed:
+            self.update_interferon_display()
 
         # Update milestone tracking
-        if self.game_state:
-            self.game_state.update_turn_count(self.simulation.turn_count)
-            self.game_state.update_entity_counts(self.simulation.entities, entities_created_this_turn)
+        if game_state:
+            game_state.update_turn_count(sim.turn_count)
+            game_state.update_entity_counts(entities, entities_created_this_turn)
 
         # Display log with dramatic timing
         self._display_turn_log_dramatically(turn_log)
 
-        # Update displays - now uses the new graph
-        self.update_entities_display(self.simulation.entities)
+        # Update displays - now uses the new graph (skip redraw on quiet turns)
+        if sim.entities_changed:
+            self.update_entities_display(entities)
 
     def _display_turn_log_dramatically(self, turn_log):
         """Display turn log with dramatic pauses between sections"""
@@ -3064,16 +3265,14 @@ class PlayModule(GameModule):
 
         # Display each section with delays
         for i, section in enumerate(sections):
-            # Add the section messages
-            for message in section:
-                self.add_console_message(message)
+            # Add the section messages (one insert + one scroll per section)
+            self.add_console_messages(section)
 
             # Add delay between sections (but not after the last section)
             if i < len(sections) - 1:
                 self.frame.update_idletasks()  # Update UI
                 self.frame.after(100)  # 0.5 second delay
                 # We need to use a different approach for the delay since after() is non-blocking
-                import time
                 time.sleep(0.1)
 
     def _parse_turn_log_into_sections(self, turn_log):
@@ -3109,12 +3308,7 @@ class PlayModule(GameModule):
                 if current_event:
                     sections.append(current_event)
                 current_event = [line]
-            elif in_events and current_event and (line_content.startswith("Consumed:") or
-                                                  line_content.startswith("Produced:") or
-                                                  line_content.startswith("Degraded:") or
-                                                  line_content.startswith("- ") or
-                                                  line_content.startswith("+ ") or
-                                                  line_content.startswith("  ") or  # Indented event details
+            elif in_events and current_event and (line_content.startswith(_EVENT_DETAIL_PREFIXES) or
                                                   "No events occurred" in line_content):
                 current_event.append(line)
             elif "Population at end:" in line_content:
@@ -3292,6 +3486,11 @@ class PlayModule(GameModule):
 
     def show_victory_dialog(self):
         """Show congratulatory dialog when victory condition is reached"""
+        # Bind frequently used widget constructors/constants to locals
+        # (global attribute lookups are slow in tight dialog-construction code)
+        Frame, Label, Button = ttk.Frame, ttk.Label, ttk.Button
+        END, X, BOTH, LEFT, RIGHT = tk.END, tk.X, tk.BOTH, tk.LEFT, tk.RIGHT
+
         self.add_console_message("\n" + "=" * 50)
         self.add_console_message("RUNAWAY REACTION ACHIEVED!")
         self.add_console_message("=" * 50)
@@ -3299,28 +3498,18 @@ class PlayModule(GameModule):
         self.add_console_message("Congratulations! Your virus has succeeded beyond all expectations!")
         self.add_console_message("")
 
-        dialog = tk.Toplevel(self.frame)
-        dialog.title("VICTORY!")
-        dialog.geometry("500x400")
-        dialog.transient(self.frame)
-        dialog.grab_set()
-
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (250)
-        y = (dialog.winfo_screenheight() // 2) - (200)
-        dialog.geometry(f"500x400+{x}+{y}")
+        dialog = self._make_modal_dialog("VICTORY!", 500, 400)
 
         # Header with victory styling
-        header_frame = ttk.Frame(dialog)
-        header_frame.pack(fill=tk.X, padx=20, pady=20)
+        header_frame = Frame(dialog)
+        header_frame.pack(fill=X, padx=20, pady=20)
 
-        ttk.Label(header_frame, text="🎉 VICTORY! 🎉", font=("Arial", 18, "bold"),
-                  foreground="green").pack()
+        Label(header_frame, text="🎉 VICTORY! 🎉", font=("Arial", 18, "bold"),
+              foreground="green").pack()
 
         # Victory message
-        message_frame = ttk.Frame(dialog)
-        message_frame.pack(fill=tk.BOTH, expand=True, padx=20)
+        message_frame = Frame(dialog)
+        message_frame.pack(fill=BOTH, expand=True, padx=20)
 
         victory_text = (
             "Congratulations!\n\n"
@@ -3330,25 +3519,25 @@ class PlayModule(GameModule):
             "overwhelmed all natural limitations and achieved exponential growth."
         )
 
-        ttk.Label(message_frame, text=victory_text, font=("Arial", 11),
-                  justify=tk.CENTER, wraplength=450).pack()
+        Label(message_frame, text=victory_text, font=("Arial", 11),
+              justify=tk.CENTER, wraplength=450).pack()
 
         # Entity production statistics
         if self.game_state and (self.game_state.cumulative_entity_counts or self.game_state.peak_entity_counts):
             stats_frame = ttk.LabelFrame(message_frame, text="Final Production Statistics", padding=10)
-            stats_frame.pack(fill=tk.BOTH, expand=True, pady=(15, 0))
+            stats_frame.pack(fill=BOTH, expand=True, pady=(15, 0))
 
             # Create text widget for statistics with scrollbar
-            text_frame = ttk.Frame(stats_frame)
-            text_frame.pack(fill=tk.BOTH, expand=True)
+            text_frame = Frame(stats_frame)
+            text_frame.pack(fill=BOTH, expand=True)
 
             stats_text = tk.Text(text_frame, height=6, width=50, state='disabled',
                                  font=("Consolas", 9), wrap=tk.WORD)
             scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=stats_text.yview)
             stats_text.config(yscrollcommand=scrollbar.set)
 
-            stats_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            stats_text.pack(side=LEFT, fill=BOTH, expand=True)
+            scrollbar.pack(side=RIGHT, fill=tk.Y)
 
             # Populate statistics
             stats_text.config(state='normal')
@@ -3358,8 +3547,8 @@ class PlayModule(GameModule):
                 self.game_state.peak_entity_counts.keys())
 
             if all_classes:
-                stats_text.insert(tk.END, "Produced in total this round: (peak)\n")
-                stats_text.insert(tk.END, "-" * 35 + "\n")
+                stats_text.insert(END, "Produced in total this round: (peak)\n")
+                stats_text.insert(END, "-" * 35 + "\n")
 
                 # Sort classes by total produced (descending), then by name
                 sorted_classes = sorted(all_classes,
@@ -3371,28 +3560,27 @@ class PlayModule(GameModule):
 
                     # Only show if there was some production or peak
                     if total > 0 or peak > 0:
-                        stats_text.insert(tk.END, f"{entity_class:12} {total:4d} ({peak:2d})\n")
+                        stats_text.insert(END, f"{entity_class:12} {total:4d} ({peak:2d})\n")
 
             stats_text.config(state='disabled')
 
         # Game over notice
-        ending_frame = ttk.Frame(message_frame)
-        ending_frame.pack(fill=tk.X, pady=(15, 0))
+        ending_frame = Frame(message_frame)
+        ending_frame.pack(fill=X, pady=(15, 0))
 
         ending_text = ("This simulation session is now complete. You have achieved "
                        "the ultimate victory condition!")
-        ttk.Label(ending_frame, text=ending_text, font=("Arial", 10, "bold"),
-                  justify=tk.CENTER, wraplength=450, foreground="blue").pack()
+        Label(ending_frame, text=ending_text, font=("Arial", 10, "bold"),
+              justify=tk.CENTER, wraplength=450, foreground="blue").pack()
 
         # Close button
-        button_frame = ttk.Frame(dialog)
-        button_frame.pack(fill=tk.X, padx=20, pady=20)
+        button_frame = Frame(dialog)
+        button_frame.pack(fill=X, padx=20, pady=20)
 
-        ttk.Button(button_frame, text="Close Simulation",
-                   command=lambda: self._close_victory_dialog(dialog)).pack()
+        Button(button_frame, text="Close Simulation",
+               command=lambda: self._close_victory_dialog(dialog)).pack()
 
-        # Auto-focus and handle escape key
-        dialog.focus_set()
+        # Escape routes through the victory handler instead of plain destroy
         dialog.bind('<Escape>', lambda e: self._close_victory_dialog(dialog))
 
     def _close_victory_dialog(self, dialog):
@@ -3407,28 +3595,22 @@ class PlayModule(GameModule):
 
     def show_extinction_dialog(self):
         """Show confirmation dialog when virus goes extinct"""
-        dialog = tk.Toplevel(self.frame)
-        dialog.title("Simulation Complete")
-        dialog.geometry("500x400")
-        dialog.transient(self.frame)
-        dialog.grab_set()
+        # Local bindings for the hot widget constructors/constants
+        Frame, Label, Button = ttk.Frame, ttk.Label, ttk.Button
+        END, X, BOTH, LEFT, RIGHT = tk.END, tk.X, tk.BOTH, tk.LEFT, tk.RIGHT
 
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (250)
-        y = (dialog.winfo_screenheight() // 2) - (200)
-        dialog.geometry(f"500x400+{x}+{y}")
+        dialog = self._make_modal_dialog("Simulation Complete", 500, 400)
 
         # Icon and header
-        header_frame = ttk.Frame(dialog)
-        header_frame.pack(fill=tk.X, padx=20, pady=20)
+        header_frame = Frame(dialog)
+        header_frame.pack(fill=X, padx=20, pady=20)
 
-        ttk.Label(header_frame, text="Virus Extinction", font=("Arial", 16, "bold"),
-                  foreground="red").pack()
+        Label(header_frame, text="Virus Extinction", font=("Arial", 16, "bold"),
+              foreground="red").pack()
 
         # Message
-        message_frame = ttk.Frame(dialog)
-        message_frame.pack(fill=tk.BOTH, expand=True, padx=20)
+        message_frame = Frame(dialog)
+        message_frame.pack(fill=BOTH, expand=True, padx=20)
 
         message_text = (
             f"Your virus has gone extinct!\n\n"
@@ -3436,25 +3618,25 @@ class PlayModule(GameModule):
             "all viral entities were eliminated.\n"
         )
 
-        ttk.Label(message_frame, text=message_text, font=("Arial", 11),
-                  justify=tk.CENTER, wraplength=450).pack()
+        Label(message_frame, text=message_text, font=("Arial", 11),
+              justify=tk.CENTER, wraplength=450).pack()
 
         # Entity production statistics
         if self.game_state and (self.game_state.cumulative_entity_counts or self.game_state.peak_entity_counts):
             stats_frame = ttk.LabelFrame(message_frame, text="Entity Production Statistics", padding=10)
-            stats_frame.pack(fill=tk.BOTH, expand=True, pady=(15, 0))
+            stats_frame.pack(fill=BOTH, expand=True, pady=(15, 0))
 
             # Create text widget for statistics with scrollbar
-            text_frame = ttk.Frame(stats_frame)
-            text_frame.pack(fill=tk.BOTH, expand=True)
+            text_frame = Frame(stats_frame)
+            text_frame.pack(fill=BOTH, expand=True)
 
             stats_text = tk.Text(text_frame, height=8, width=50, state='disabled',
                                  font=("Consolas", 9), wrap=tk.WORD)
             scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=stats_text.yview)
             stats_text.config(yscrollcommand=scrollbar.set)
 
-            stats_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            stats_text.pack(side=LEFT, fill=BOTH, expand=True)
+            scrollbar.pack(side=RIGHT, fill=tk.Y)
 
             # Populate statistics
             stats_text.config(state='normal')
@@ -3464,8 +3646,8 @@ class PlayModule(GameModule):
                 self.game_state.peak_entity_counts.keys())
 
             if all_classes:
-                stats_text.insert(tk.END, "Produced in total this round: (peak)\n")
-                stats_text.insert(tk.END, "-" * 35 + "\n")
+                stats_text.insert(END, "Produced in total this round: (peak)\n")
+                stats_text.insert(END, "-" * 35 + "\n")
 
                 # Sort classes by total produced (descending), then by name
                 sorted_classes = sorted(all_classes,
@@ -3477,34 +3659,30 @@ class PlayModule(GameModule):
 
                     # Only show if there was some production or peak
                     if total > 0 or peak > 0:
-                        stats_text.insert(tk.END, f"{entity_class:12} {total:4d} ({peak:2d})\n")
+                        stats_text.insert(END, f"{entity_class:12} {total:4d} ({peak:2d})\n")
             else:
-                stats_text.insert(tk.END, "No entities were produced during this simulation.")
+                stats_text.insert(END, "No entities were produced during this simulation.")
 
             stats_text.config(state='disabled')
 
         # Closing message
-        closing_frame = ttk.Frame(message_frame)
-        closing_frame.pack(fill=tk.X, pady=(15, 0))
+        closing_frame = Frame(message_frame)
+        closing_frame.pack(fill=X, pady=(15, 0))
 
         closing_text = ("Take a moment to review the simulation log to understand "
                         "what happened, then return to the Builder to try again.")
-        ttk.Label(closing_frame, text=closing_text, font=("Arial", 10),
-                  justify=tk.CENTER, wraplength=450).pack()
+        Label(closing_frame, text=closing_text, font=("Arial", 10),
+              justify=tk.CENTER, wraplength=450).pack()
 
         # Buttons
-        button_frame = ttk.Frame(dialog)
-        button_frame.pack(fill=tk.X, padx=20, pady=20)
+        button_frame = Frame(dialog)
+        button_frame.pack(fill=X, padx=20, pady=20)
 
-        ttk.Button(button_frame, text="Review Results",
-                   command=dialog.destroy).pack(side=tk.LEFT, padx=(0, 10))
+        Button(button_frame, text="Review Results",
+               command=dialog.destroy).pack(side=LEFT, padx=(0, 10))
 
-        ttk.Button(button_frame, text="Return to Builder",
-                   command=lambda: self.confirm_return_to_builder(dialog)).pack(side=tk.RIGHT)
-
-        # Auto-focus and handle escape key
-        dialog.focus_set()
-        dialog.bind('<Escape>', lambda e: dialog.destroy())
+        Button(button_frame, text="Return to Builder",
+               command=lambda: self.confirm_return_to_builder(dialog)).pack(side=RIGHT)
 
     def confirm_return_to_builder(self, dialog):
         """Confirm return to builder and close dialog"""
@@ -3517,6 +3695,33 @@ class PlayModule(GameModule):
         self.console_text.see(tk.END)
         self.console_text.config(state='disabled')
 
+    def add_console_messages(self, messages):
+        """Add multiple console lines with one insert and one scroll.
+
+        Calling see(END) per line forces Tk to recompute the visible region
+        for every insert; for bulk output do a single joined insert and
+        scroll once at the end.
+        """
+        if not messages:
+            return
+        console = self.console_text
+        console.config(state='normal')
+        console.insert(tk.END, "\n".join(messages) + "\n")
+        self._trim_console()
+        console.see(tk.END)
+        console.config(state='disabled')
+
+    def _trim_console(self, max_lines=5000, trim_to=4000):
+        """Drop the oldest console lines once the buffer exceeds max_lines.
+
+        Long sessions would otherwise grow the Text widget without bound,
+        making every insert slower. A single range delete removes the
+        overflow prefix in one call. Expects the widget in 'normal' state.
+        """
+        line_count = int(self.console_text.index('end-1c').split('.')[0])
+        if line_count > max_lines:
+            self.console_text.delete("1.0", f"{line_count - trim_to + 1}.0")
+
     def _extract_entities_created(self, turn_log: list[str]) -> dict[str, int]:
         """Extract entities created this turn from the simulation log"""
         entities_created: dict[str, int] = {}
@@ -3577,76 +3782,77 @@ class PlayModule(GameModule):
     def _show_milestone_dialog_blocking(self, newly_achieved: list[dict], open_milestones: list[dict],
                                         progress_data: dict):
         """Show a dialog listing milestone achievements and open milestones from this run (BLOCKING VERSION)"""
-        dialog = tk.Toplevel(self.frame)
-        dialog.title("Milestone Progress")
-        dialog.geometry("600x500")
-        dialog.transient(self.frame)
-        dialog.grab_set()
+        # Local bindings for the hot widget constructors/constants
+        Frame, Label = ttk.Frame, ttk.Label
+        END, X, BOTH = tk.END, tk.X, tk.BOTH
 
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (300)
-        y = (dialog.winfo_screenheight() // 2) - (250)
-        dialog.geometry(f"600x500+{x}+{y}")
+        dialog = self._make_modal_dialog("Milestone Progress", 600, 500)
 
         # Header
-        header_frame = ttk.Frame(dialog)
-        header_frame.pack(fill=tk.X, padx=20, pady=20)
+        header_frame = Frame(dialog)
+        header_frame.pack(fill=X, padx=20, pady=20)
 
         if newly_achieved:
-            ttk.Label(header_frame, text="Milestones Achieved!", font=("Arial", 16, "bold")).pack()
-            total_ep = sum(m["reward_ep"] for m in newly_achieved)
-            ttk.Label(header_frame, text=f"You earned {total_ep} Evolution Points!",
-                      font=("Arial", 12), foreground="green").pack(pady=(5, 0))
+            Label(header_frame, text="Milestones Achieved!", font=("Arial", 16, "bold")).pack()
+            total_ep = progress_data.get("newly_achieved_ep_total", 0)
+            Label(header_frame, text=f"You earned {total_ep} Evolution Points!",
+                  font=("Arial", 12), foreground="green").pack(pady=(5, 0))
         else:
-            ttk.Label(header_frame, text="Milestone Progress", font=("Arial", 16, "bold")).pack()
-            ttk.Label(header_frame, text="Keep working towards your goals!",
-                      font=("Arial", 12), foreground="blue").pack(pady=(5, 0))
-
-        # Create notebook for tabs
-        notebook = ttk.Notebook(dialog)
-        notebook.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 10))
+            Label(header_frame, text="Milestone Progress", font=("Arial", 16, "bold")).pack()
+            Label(header_frame, text="Keep working towards your goals!",
+                  font=("Arial", 12), foreground="blue").pack(pady=(5, 0))
+
+        # Create notebook for tabs - only needed when BOTH lists have content.
+        # With a single populated list, pack its text widget directly into the
+        # dialog and skip the Notebook/tab construction entirely.
+        use_notebook = bool(newly_achieved) and bool(open_milestones)
+        if use_notebook:
+            notebook = ttk.Notebook(dialog)
+            notebook.pack(fill=BOTH, expand=True, padx=20, pady=(0, 10))
 
         # Achievements tab (only if there are achievements)
         if newly_achieved:
-            achievements_frame = ttk.Frame(notebook)
-            notebook.add(achievements_frame, text=f"Achieved ({len(newly_achieved)})")
+            if use_notebook:
+                achievements_frame = Frame(notebook)
+                notebook.add(achievements_frame, text=f"Achieved ({len(newly_achieved)})")
+            else:
+                achievements_frame = dialog
 
             achievements_text = scrolledtext.ScrolledText(achievements_frame, height=15, wrap=tk.WORD, state='disabled')
-            achievements_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-            # Populate achievements
+            achievements_text.pack(fill=BOTH, expand=True, padx=10, pady=10)
+
+            # Populate achievements - one preformatted block, single insert
+            blocks = [
+                f"[ACHIEVED] {m['name']}\n"
+                f"   {m['description']}\n"
+                f"   Reward: +{m['reward_ep']} EP\n"
+                for m in newly_achieved
+            ]
             achievements_text.config(state='normal')
-            for milestone in newly_achieved:
-                name = milestone["name"]
-                desc = milestone["description"]
-                reward = milestone["reward_ep"]
-
-                achievements_text.insert(tk.END, f"[ACHIEVED] {name}\n")
-                achievements_text.insert(tk.END, f"   {desc}\n")
-                achievements_text.insert(tk.END, f"   Reward: +{reward} EP\n\n")
+            achievements_text.insert(END, "\n".join(blocks) + "\n")
             achievements_text.config(state='disabled')
 
         # Open milestones tab (only if there are open milestones)
         if open_milestones:
-            open_frame = ttk.Frame(notebook)
-            notebook.add(open_frame, text=f"In Progress ({len(open_milestones)})")
+            if use_notebook:
+                open_frame = Frame(notebook)
+                notebook.add(open_frame, text=f"In Progress ({len(open_milestones)})")
+            else:
+                open_frame = dialog
 
             open_text = scrolledtext.ScrolledText(open_frame, height=15, wrap=tk.WORD, state='disabled')
-            open_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-            # Populate open milestones with progress
+            open_text.pack(fill=BOTH, expand=True, padx=10, pady=10)
+
+            # Populate open milestones with progress - one block, single insert
+            blocks = [
+                f"[IN PROGRESS] {m['name']}\n"
+                f"   {m['description']}\n"
+                f"   Progress: {m.get('progress_description', 'No progress')}\n"
+                f"   Reward: {m['reward_ep']} EP\n"
+                for m in open_milestones
+            ]
             open_text.config(state='normal')
-            for milestone in open_milestones:
-                name = milestone["name"]
-                desc = milestone["description"]
-                reward = milestone["reward_ep"]
-                progress_desc = milestone.get("progress_description", "No progress")
-
-                open_text.insert(tk.END, f"[IN PROGRESS] {name}\n")
-                open_text.insert(tk.END, f"   {desc}\n")
-                open_text.insert(tk.END, f"   Progress: {progress_desc}\n")
-                open_text.insert(tk.END, f"   Reward: {reward} EP\n\n")
+            open_text.insert(END, "\n".join(blocks) + "\n")
             open_text.config(state='disabled')
 
         # Progress summary
@@ -3656,30 +3862,129 @@ class PlayModule(GameModule):
             total_ep = progress_data.get("total_ep_earned", 0)
 
             summary_text = f"Overall Progress: {achieved_count}/{total_count} milestones completed ({total_ep} EP earned)"
-            ttk.Label(dialog, text=summary_text, font=("Arial", 10, "italic")).pack(pady=(0, 10))
+            Label(dialog, text=summary_text, font=("Arial", 10, "italic")).pack(pady=(0, 10))
 
         # Close button
         ttk.Button(dialog, text="Continue", command=dialog.destroy).pack(pady=(0, 20))
 
-        # Auto-focus and handle escape key
-        dialog.focus_set()
-        dialog.bind('<Escape>', lambda e: dialog.destroy())
-
         # CRITICAL: Wait for dialog to close before continuing (makes it blocking)
         self.frame.wait_window(dialog)
 
 
+def _format_enable_effect(effect):
+    """Display string for an enable_entity effect"""
+    return f"Enable: {effect.get('entity', 'Unknown')}"
+
+
+def _format_add_transition_effect(effect):
+    """Display string for an add_transition effect"""
+    rule = effect.get("rule", {})
+    rule_name = rule.get("name", "Unknown")
+
+    # Build compact summary showing entity counts
+    inputs = rule.get("inputs", [])
+    outputs = rule.get("outputs", [])
+    input_summary = f"{len(inputs)} input{'s' if len(inputs) != 1 else ''}" if inputs else ""
+    output_summary = f"{len(outputs)} output{'s' if len(outputs) != 1 else ''}" if outputs else ""
+
+    # Check for interferon
+    interferon_amount = rule.get("interferon_amount", 0.0)
+    interferon_part = f", IFN: {interferon_amount:.2f}" if interferon_amount > 0 else ""
+
+    # Build final description
+    if input_summary and output_summary:
+        return f"Transition: {rule_name} ({input_summary} → {output_summary}{interferon_part})"
+    elif input_summary:
+        return f"Transition: {rule_name} ({input_summary}{interferon_part})"
+    else:
+        return f"Transition: {rule_name}{interferon_part}"
+
+
+def _format_modify_transition_effect(effect):
+    """Display string for a modify_transition effect"""
+    rule_name = effect.get("rule_name", "Unknown")
+    modification = effect.get("modification", {})
+
+    # Check for modifications
+    prob_mult = modification.get("probability_multiplier", 1.0)
+    ifn_mult = modification.get("interferon_multiplier", 1.0)
+
+    mod_parts = []
+    if prob_mult != 1.0:
+        mod_parts.append(f"prob×{prob_mult:.1f}")
+    if ifn_mult != 1.0:
+        mod_parts.append(f"IFN×{ifn_mult:.2f}")
+
+    if mod_parts:
+        return f"Modify: {rule_name} ({', '.join(mod_parts)})"
+    else:
+        return f"Modify: {rule_name}"
+
+
+def _format_unknown_effect(effect):
+    """Fallback display string for unrecognized effect types"""
+    return f"Unknown: {effect.get('type', 'unknown')}"
+
+
+# Formatter dispatch table keyed by effect type
+_EFFECT_FORMATTERS = {
+    "enable_entity": _format_enable_effect,
+    "add_transition": _format_add_transition_effect,
+    "modify_transition": _format_modify_transition_effect,
+}
+
+
 class EditorModule(GameModule):
     """Gene database editor module with tabs for entities, genes, and milestones - WITH MILESTONE SUPPORT, INTERFERON DESCRIPTIONS, AND POLYMERASE GENE SUPPORT"""
 
+    # Tear down Genes/Milestones tab widgets when the user navigates away,
+    # trading a rebuild on return for lower resident memory. Set False to
+    # keep built tabs alive for the whole session.
+    DESTROY_HIDDEN_TABS = True
+
+    # Trailing-edge debounce for list selections; holding an arrow key then
+    # loads only the final row instead of one load per selection event
+    SELECT_DEBOUNCE_MS = 120
+
     def __init__(self, parent, controller):
         self.db_manager = GeneDatabaseManager()
         self.current_entity_name = None  # Track currently selected entity
         self.current_gene_name = None  # Track currently selected gene
         self.current_milestone_id = None  # Track currently selected milestone
+        # Tabs are built lazily on first selection (entities is the default tab)
+        self._tab_built = {"entities": False, "genes": False, "milestones": False}
+        self._previous_tab = None  # Last selected tab, for destroy-on-hide
+        self._select_after_ids = {}  # Pending debounced selection loads per list
+        self._prereq_set = set()  # Mirrors prereq_listbox for O(1) membership
+        # Last rows shown per listbox, so unchanged refreshes can be skipped
+        self._listbox_rows = {}
+        # Formatted effect descriptions keyed by effect repr
+        self._effect_desc_cache = {}
+        # Names backing each listbox row, so selection handlers can index
+        # straight into these instead of parsing the display text
+        self._entity_names_by_index = []
+        self._gene_names_by_index = []
+        self._milestone_ids_by_index = []
+        # Manager versions last rendered, so update_* calls against an
+        # unchanged collection can return before rebuilding any rows
+        self._entity_list_version = None
+        self._gene_list_version = None
+        self._milestone_list_version = None
+        self._db_display_version = None
+        # Versions at which the current form contents were loaded, so
+        # re-selecting the same unmodified item skips the form rewrite
+        self._loaded_entity_version = None
+        self._loaded_gene_version = None
+        self._loaded_milestone_version = None
+        self._notify_pending = False  # Coalesces controller change notifications
         super().__init__(parent, controller)
 
     def setup_ui(self):
+        # Shared fonts: registering them once avoids re-parsing the same
+        # ("Arial", N, "italic") spec for every help/status label below
+        self._font_help = tkfont.Font(family="Arial", size=9, slant="italic")
+        self._font_status = tkfont.Font(family="Arial", size=10, slant="italic")
+
         # Header
         header_frame = ttk.Frame(self.frame)
         header_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -3703,54 +4008,115 @@ class EditorModule(GameModule):
 
         info_grid = ttk.Frame(info_frame)
         info_grid.pack(fill=tk.X)
+        # Freeze geometry propagation while the form is populated so Tk
+        # solves the grid once at the end instead of after every .grid() call
+        info_grid.grid_propagate(False)
 
         # Database name and version
         ttk.Label(info_grid, text="Name:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
-        self.db_name_var = tk.StringVar()
-        self.db_name_entry = ttk.Entry(info_grid, textvariable=self.db_name_var, width=30)
+        self.db_name_entry = ttk.Entry(info_grid, width=30)
         self.db_name_entry.grid(row=0, column=1, sticky=tk.W, padx=(0, 20))
 
         ttk.Label(info_grid, text="Version:").grid(row=0, column=2, sticky=tk.W, padx=(0, 5))
-        self.db_version_var = tk.StringVar()
-        self.db_version_entry = ttk.Entry(info_grid, textvariable=self.db_version_var, width=10)
+        self.db_version_entry = ttk.Entry(info_grid, width=10)
         self.db_version_entry.grid(row=0, column=3, sticky=tk.W)
 
-        # Description
+        # Description (a plain Entry - database blurbs are one-liners, and an
+        # Entry is much cheaper than a full Text engine on the always-built header)
         ttk.Label(info_grid, text="Description:").grid(row=1, column=0, sticky=tk.NW, padx=(0, 5), pady=(10, 0))
-        self.db_desc_text = tk.Text(info_grid, height=2, width=60)
-        self.db_desc_text.grid(row=1, column=1, columnspan=3, sticky=tk.W, pady=(10, 0))
+        self.db_desc_entry = ttk.Entry(info_grid, width=80)
+        self.db_desc_entry.grid(row=1, column=1, columnspan=3, sticky=tk.W, pady=(10, 0))
+
+        info_grid.update_idletasks()
+        info_grid.grid_propagate(True)
 
         # Status
-        self.status_label = ttk.Label(info_frame, text="No database loaded", font=("Arial", 10, "italic"))
+        self.status_label = ttk.Label(info_frame, text="No database loaded", font=self._font_status)
         self.status_label.pack(anchor=tk.W, pady=(10, 0))
 
-        # Main content area with tabs
+        # Main content area with tabs. The notebook stays unmapped until its
+        # tabs are in place so every child pack/grid below resolves in a
+        # single geometry pass instead of one per widget.
         self.notebook = ttk.Notebook(self.frame)
-        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        # Entities tab
+        # Entities tab - built eagerly since it's the default selection
         self.entities_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.entities_frame, text="Entities")
         self.setup_entities_tab()
+        self._tab_built["entities"] = True
 
-        # Genes tab
+        # Genes and Milestones tabs start as empty frames; their widgets are
+        # built on first selection so opening the editor only pays for one tab
         self.genes_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.genes_frame, text="Genes")
-        self.setup_genes_tab()
 
-        # Milestones tab
         self.milestones_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.milestones_frame, text="Milestones")
-        self.setup_milestones_tab()
 
-        # Initialize displays
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        # Initialize displays (deferred tabs refresh themselves when built)
         self.update_database_display()
         self.update_entity_list()
-        self.update_gene_list()
-        self.update_milestone_list()
         self.clear_entity_form()
-        self.clear_gene_form()
-        self.clear_milestone_form()
+
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab on demand; optionally tear down the old one"""
+        tab_text = self.notebook.tab(self.notebook.select(), "text")
+
+        if tab_text == "Genes" and not self._tab_built["genes"]:
+            self._tab_built["genes"] = True
+            self._build_tab_unmapped(self.setup_genes_tab)
+            self.update_gene_list()
+            self.clear_gene_form()
+        elif tab_text == "Milestones" and not self._tab_built["milestones"]:
+            self._tab_built["milestones"] = True
+            self._build_tab_unmapped(self.setup_milestones_tab)
+            self.update_milestone_list()
+            self.clear_milestone_form()
+
+        if self.DESTROY_HIDDEN_TABS:
+            self._destroy_hidden_tab(tab_text)
+        self._previous_tab = tab_text
+
+    def _destroy_hidden_tab(self, current_tab):
+        """Release the widgets of the tab we just navigated away from.
+
+        Only the deferred Genes/Milestones tabs participate - their refresh
+        and clear paths already no-op while unbuilt, so the next selection
+        rebuilds them from the current database state. Entities is the
+        default tab and stays resident.
+        """
+        previous = self._previous_tab
+        if previous == current_tab or previous not in ("Genes", "Milestones"):
+            return
+
+        if previous == "Genes":
+            frame, key = self.genes_frame, "genes"
+            self._listbox_rows.pop(str(self.gene_listbox), None)
+            self._gene_list_version = None
+        else:
+            frame, key = self.milestones_frame, "milestones"
+            self._listbox_rows.pop(str(self.milestone_listbox), None)
+            self._milestone_list_version = None
+
+        for child in frame.winfo_children():
+            child.destroy()
+        self._tab_built[key] = False
+
+    def _build_tab_unmapped(self, setup_tab):
+        """Run a setup_*_tab while the notebook is unmapped.
+
+        With the notebook withdrawn, the dozens of pack/grid calls in a tab
+        build queue up and Tk solves the layout once on re-pack, instead of
+        recomputing geometry after every widget.
+        """
+        self.notebook.pack_forget()
+        try:
+            setup_tab()
+        finally:
+            self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
     def setup_entities_tab(self):
         """Setup the entities tab - WITH STARTER ENTITY CHECKBOX"""
@@ -3769,11 +4135,9 @@ class EditorModule(GameModule):
         self.entity_listbox = tk.Listbox(entity_list_frame, width=35, height=20)
         self.entity_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        # Multiple event bindings
+        # Selection handling funnels through the virtual select event
         self.entity_listbox.bind('<<ListboxSelect>>', self.on_entity_select)
-        self.entity_listbox.bind('<Button-1>', self.on_entity_click)
-        self.entity_listbox.bind('<ButtonRelease-1>', self.on_entity_click)
-        self.entity_listbox.bind('<Double-Button-1>', self.on_entity_double_click)
+        self.entity_listbox.bind('<Double-Button-1>', self.on_entity_select)
 
         entity_scrollbar = ttk.Scrollbar(entity_list_frame, orient=tk.VERTICAL, command=self.entity_listbox.yview)
         entity_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -3787,7 +4151,7 @@ class EditorModule(GameModule):
         ttk.Button(entity_btn_frame, text="Clone Entity", command=self.clone_entity).pack(side=tk.LEFT, padx=(0, 5))
 
         # Instructions
-        ttk.Label(left_frame, text="Click entity to edit →", font=("Arial", 9, "italic")).pack(pady=(5, 0))
+        ttk.Label(left_frame, text="Click entity to edit →", font=self._font_help).pack(pady=(5, 0))
 
         # Right panel - Entity editor
         self.entity_editor_frame = ttk.LabelFrame(main_frame, text="Entity Editor", padding=10)
@@ -3795,7 +4159,7 @@ class EditorModule(GameModule):
 
         # Simple status label
         self.entity_status_label = ttk.Label(self.entity_editor_frame, text="No entity selected",
-                                             font=("Arial", 10, "italic"))
+                                             font=self._font_status)
         self.entity_status_label.pack(anchor=tk.W, pady=(0, 10))
 
         # Entity properties
@@ -3804,11 +4168,13 @@ class EditorModule(GameModule):
 
         props_grid = ttk.Frame(props_frame)
         props_grid.pack(fill=tk.X)
+        # Freeze geometry propagation while the form is populated so Tk
+        # solves the grid once at the end instead of after every .grid() call
+        props_grid.grid_propagate(False)
 
         # Entity name
         ttk.Label(props_grid, text="Name:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
-        self.entity_name_var = tk.StringVar()
-        self.entity_name_entry = ttk.Entry(props_grid, textvariable=self.entity_name_var, width=40)
+        self.entity_name_entry = ttk.Entry(props_grid, width=40)
         self.entity_name_entry.grid(row=0, column=1, columnspan=3, sticky=tk.W, pady=(0, 5))
 
         # Description
@@ -3819,26 +4185,25 @@ class EditorModule(GameModule):
         # Degradation rate
         ttk.Label(props_grid, text="Base Degradation Rate:").grid(row=2, column=0, sticky=tk.W, padx=(0, 5),
                                                                   pady=(5, 0))
-        self.degradation_var = tk.DoubleVar(value=0.05)
         degradation_frame = ttk.Frame(props_grid)
         degradation_frame.grid(row=2, column=1, sticky=tk.W, pady=(5, 0))
 
-        ttk.Entry(degradation_frame, textvariable=self.degradation_var, width=10).pack(side=tk.LEFT)
-        ttk.Label(degradation_frame, text="(0.0 - 1.0)", font=("Arial", 9, "italic")).pack(side=tk.LEFT, padx=(5, 0))
+        self.degradation_entry = ttk.Entry(degradation_frame, width=10)
+        self.degradation_entry.insert(0, "0.05")
+        self.degradation_entry.pack(side=tk.LEFT)
+        ttk.Label(degradation_frame, text="(0.0 - 1.0)", font=self._font_help).pack(side=tk.LEFT, padx=(5, 0))
 
         # Location
         ttk.Label(props_grid, text="Location:").grid(row=3, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0))
-        self.location_var = tk.StringVar()
-        location_combo = ttk.Combobox(props_grid, textvariable=self.location_var, width=20)
-        location_combo['values'] = ('extracellular', 'cytoplasm', 'endosome', 'nucleus', 'membrane', 'unknown')
-        location_combo.grid(row=3, column=1, sticky=tk.W, pady=(5, 0))
+        self.location_combo = ttk.Combobox(props_grid, width=20)
+        self.location_combo['values'] = LOCATIONS
+        self.location_combo.grid(row=3, column=1, sticky=tk.W, pady=(5, 0))
 
         # Entity class
         ttk.Label(props_grid, text="Entity Class:").grid(row=3, column=2, sticky=tk.W, padx=(20, 5), pady=(5, 0))
-        self.entity_class_var = tk.StringVar()
-        class_combo = ttk.Combobox(props_grid, textvariable=self.entity_class_var, width=15)
-        class_combo['values'] = ('virion', 'protein', 'RNA', 'DNA', 'complex', 'unknown')
-        class_combo.grid(row=3, column=3, sticky=tk.W, pady=(5, 0))
+        self.entity_class_combo = ttk.Combobox(props_grid, width=15)
+        self.entity_class_combo['values'] = ENTITY_CLASSES
+        self.entity_class_combo.grid(row=3, column=3, sticky=tk.W, pady=(5, 0))
 
         # Starter entity checkbox
         ttk.Label(props_grid, text="Starter Entity:").grid(row=4, column=0, sticky=tk.W, padx=(0, 5), pady=(10, 0))
@@ -3850,9 +4215,12 @@ class EditorModule(GameModule):
         # Help text for starter entities
         help_text = ttk.Label(props_grid,
                               text="Starter entities can be selected as initial entities when building a virus",
-                              font=("Arial", 9, "italic"), foreground="gray")
+                              font=self._font_help, foreground="gray")
         help_text.grid(row=5, column=1, columnspan=3, sticky=tk.W, pady=(5, 0))
 
+        props_grid.update_idletasks()
+        props_grid.grid_propagate(True)
+
         # Simple button layout
         button_frame = ttk.Frame(self.entity_editor_frame)
         button_frame.pack(pady=10)
@@ -3881,9 +4249,7 @@ class EditorModule(GameModule):
 
         # Multiple event bindings
         self.gene_listbox.bind('<<ListboxSelect>>', self.on_gene_select)
-        self.gene_listbox.bind('<Button-1>', self.on_gene_click)
-        self.gene_listbox.bind('<ButtonRelease-1>', self.on_gene_click)
-        self.gene_listbox.bind('<Double-Button-1>', self.on_gene_double_click)
+        self.gene_listbox.bind('<Double-Button-1>', self.on_gene_select)
 
         gene_scrollbar = ttk.Scrollbar(gene_list_frame, orient=tk.VERTICAL, command=self.gene_listbox.yview)
         gene_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -3897,7 +4263,7 @@ class EditorModule(GameModule):
         ttk.Button(gene_btn_frame, text="Clone Gene", command=self.clone_gene).pack(side=tk.LEFT, padx=(0, 5))
 
         # Instructions
-        ttk.Label(left_frame, text="Click gene to edit →", font=("Arial", 9, "italic")).pack(pady=(5, 0))
+        ttk.Label(left_frame, text="Click gene to edit →", font=self._font_help).pack(pady=(5, 0))
 
         # Right panel - Gene editor
         self.gene_editor_frame = ttk.LabelFrame(main_frame, text="Gene Editor", padding=10)
@@ -3905,7 +4271,7 @@ class EditorModule(GameModule):
 
         # Simple status label
         self.gene_status_label = ttk.Label(self.gene_editor_frame, text="No gene selected",
-                                           font=("Arial", 10, "italic"))
+                                           font=self._font_status)
         self.gene_status_label.pack(anchor=tk.W, pady=(0, 10))
 
         # Gene properties
@@ -3914,17 +4280,18 @@ class EditorModule(GameModule):
 
         props_grid = ttk.Frame(props_frame)
         props_grid.pack(fill=tk.X)
+        # Freeze geometry propagation while the form is populated so Tk
+        # solves the grid once at the end instead of after every .grid() call
+        props_grid.grid_propagate(False)
 
         # Gene name
         ttk.Label(props_grid, text="Name:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
-        self.gene_name_var = tk.StringVar()
-        self.gene_name_entry = ttk.Entry(props_grid, textvariable=self.gene_name_var, width=30)
+        self.gene_name_entry = ttk.Entry(props_grid, width=30)
         self.gene_name_entry.grid(row=0, column=1, sticky=tk.W, padx=(0, 20))
 
         # Gene cost
         ttk.Label(props_grid, text="Cost:").grid(row=0, column=2, sticky=tk.W, padx=(0, 5))
-        self.gene_cost_var = tk.IntVar()
-        self.gene_cost_entry = ttk.Entry(props_grid, textvariable=self.gene_cost_var, width=10)
+        self.gene_cost_entry = ttk.Entry(props_grid, width=10)
         self.gene_cost_entry.grid(row=0, column=3, sticky=tk.W)
 
         # Gene description
@@ -3956,9 +4323,12 @@ class EditorModule(GameModule):
         # Help text for polymerase genes
         polymerase_help_text = ttk.Label(props_grid,
                                          text="Only one polymerase gene can be installed in a virus at a time",
-                                         font=("Arial", 9, "italic"), foreground="gray")
+                                         font=self._font_help, foreground="gray")
         polymerase_help_text.grid(row=4, column=1, columnspan=3, sticky=tk.W, pady=(5, 0))
 
+        props_grid.update_idletasks()
+        props_grid.grid_propagate(True)
+
         # Effects section
         effects_frame = ttk.LabelFrame(self.gene_editor_frame, text="Gene Effects", padding=10)
         effects_frame.pack(fill=tk.BOTH, expand=True)
@@ -4006,9 +4376,7 @@ class EditorModule(GameModule):
 
         # Multiple event bindings
         self.milestone_listbox.bind('<<ListboxSelect>>', self.on_milestone_select)
-        self.milestone_listbox.bind('<Button-1>', self.on_milestone_click)
-        self.milestone_listbox.bind('<ButtonRelease-1>', self.on_milestone_click)
-        self.milestone_listbox.bind('<Double-Button-1>', self.on_milestone_double_click)
+        self.milestone_listbox.bind('<Double-Button-1>', self.on_milestone_select)
 
         milestone_scrollbar = ttk.Scrollbar(milestone_list_frame, orient=tk.VERTICAL,
                                             command=self.milestone_listbox.yview)
@@ -4025,7 +4393,7 @@ class EditorModule(GameModule):
                                                                                                    padx=(0, 5))
 
         # Instructions
-        ttk.Label(left_frame, text="Click milestone to edit →", font=("Arial", 9, "italic")).pack(pady=(5, 0))
+        ttk.Label(left_frame, text="Click milestone to edit →", font=self._font_help).pack(pady=(5, 0))
 
         # Right panel - Milestone editor
         self.milestone_editor_frame = ttk.LabelFrame(main_frame, text="Milestone Editor", padding=10)
@@ -4033,7 +4401,7 @@ class EditorModule(GameModule):
 
         # Simple status label
         self.milestone_status_label = ttk.Label(self.milestone_editor_frame, text="No milestone selected",
-                                                font=("Arial", 10, "italic"))
+                                                font=self._font_status)
         self.milestone_status_label.pack(anchor=tk.W, pady=(0, 10))
 
         # Milestone properties
@@ -4042,16 +4410,17 @@ class EditorModule(GameModule):
 
         props_grid = ttk.Frame(props_frame)
         props_grid.pack(fill=tk.X)
+        # Freeze geometry propagation while the form is populated so Tk
+        # solves the grid once at the end instead of after every .grid() call
+        props_grid.grid_propagate(False)
 
         # Milestone ID and Name
         ttk.Label(props_grid, text="ID:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
-        self.milestone_id_var = tk.StringVar()
-        self.milestone_id_entry = ttk.Entry(props_grid, textvariable=self.milestone_id_var, width=20)
+        self.milestone_id_entry = ttk.Entry(props_grid, width=20)
         self.milestone_id_entry.grid(row=0, column=1, sticky=tk.W, padx=(0, 20))
 
         ttk.Label(props_grid, text="Name:").grid(row=0, column=2, sticky=tk.W, padx=(0, 5))
-        self.milestone_name_var = tk.StringVar()
-        self.milestone_name_entry = ttk.Entry(props_grid, textvariable=self.milestone_name_var, width=25)
+        self.milestone_name_entry = ttk.Entry(props_grid, width=25)
         self.milestone_name_entry.grid(row=0, column=3, sticky=tk.W)
 
         # Description
@@ -4061,29 +4430,25 @@ class EditorModule(GameModule):
 
         # Milestone type
         ttk.Label(props_grid, text="Type:").grid(row=2, column=0, sticky=tk.W, padx=(0, 5), pady=(10, 0))
-        self.milestone_type_var = tk.StringVar()
-        self.milestone_type_combo = ttk.Combobox(props_grid, textvariable=self.milestone_type_var, width=25,
-                                                 state="readonly")
+        self.milestone_type_combo = ttk.Combobox(props_grid, width=25, state="readonly")
         self.milestone_type_combo['values'] = ('survive_turns', 'peak_entity_count', 'cumulative_entity_count')
         self.milestone_type_combo.grid(row=2, column=1, sticky=tk.W, pady=(10, 0))
         self.milestone_type_combo.bind('<<ComboboxSelected>>', self.on_milestone_type_change)
 
         # Target and Reward
         ttk.Label(props_grid, text="Target:").grid(row=2, column=2, sticky=tk.W, padx=(20, 5), pady=(10, 0))
-        self.milestone_target_var = tk.IntVar(value=5)
-        self.milestone_target_entry = ttk.Entry(props_grid, textvariable=self.milestone_target_var, width=10)
+        self.milestone_target_entry = ttk.Entry(props_grid, width=10)
+        self.milestone_target_entry.insert(0, "5")
         self.milestone_target_entry.grid(row=2, column=3, sticky=tk.W, pady=(10, 0))
 
         ttk.Label(props_grid, text="Reward EP:").grid(row=3, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0))
-        self.milestone_reward_var = tk.IntVar(value=25)
-        self.milestone_reward_entry = ttk.Entry(props_grid, textvariable=self.milestone_reward_var, width=10)
+        self.milestone_reward_entry = ttk.Entry(props_grid, width=10)
+        self.milestone_reward_entry.insert(0, "25")
         self.milestone_reward_entry.grid(row=3, column=1, sticky=tk.W, pady=(5, 0))
 
         # Entity class (conditional)
         ttk.Label(props_grid, text="Entity Class:").grid(row=3, column=2, sticky=tk.W, padx=(20, 5), pady=(5, 0))
-        self.milestone_entity_class_var = tk.StringVar()
-        self.milestone_entity_class_combo = ttk.Combobox(props_grid, textvariable=self.milestone_entity_class_var,
-                                                         width=15, state="readonly")
+        self.milestone_entity_class_combo = ttk.Combobox(props_grid, width=15, state="readonly")
         self.milestone_entity_class_combo.grid(row=3, column=3, sticky=tk.W, pady=(5, 0))
 
         # Help text frame
@@ -4092,9 +4457,12 @@ class EditorModule(GameModule):
 
         self.milestone_help_label = ttk.Label(self.milestone_help_frame,
                                               text="Select a milestone type to see specific instructions",
-                                              font=("Arial", 9, "italic"), foreground="gray")
+                                              font=self._font_help, foreground="gray")
         self.milestone_help_label.pack(anchor=tk.W)
 
+        props_grid.update_idletasks()
+        props_grid.grid_propagate(True)
+
         # Simple button layout
         button_frame = ttk.Frame(self.milestone_editor_frame)
         button_frame.pack(pady=10)
@@ -4108,115 +4476,61 @@ class EditorModule(GameModule):
 
     def format_effect_description(self, effect):
         """Format effect for display in list - WITH INTERFERON SUPPORT"""
-        effect_type = effect.get("type", "unknown")
-
-        if effect_type == "enable_entity":
-            return f"Enable: {effect.get('entity', 'Unknown')}"
-        elif effect_type == "add_transition":
-            rule = effect.get("rule", {})
-            rule_name = rule.get("name", "Unknown")
-
-            # Get inputs and outputs for enhanced display
-            inputs = rule.get("inputs", [])
-            outputs = rule.get("outputs", [])
-
-            # Build compact summary showing entity counts
-            input_summary = ""
-            if inputs:
-                if len(inputs) == 1:
-                    input_summary = f"1 input"
-                else:
-                    input_summary = f"{len(inputs)} inputs"
-
-            output_summary = ""
-            if outputs:
-                if len(outputs) == 1:
-                    output_summary = f"1 output"
-                else:
-                    output_summary = f"{len(outputs)} outputs"
-
-            # Check for interferon
-            interferon_amount = rule.get("interferon_amount", 0.0)
-            interferon_part = ""
-            if interferon_amount > 0:
-                interferon_part = f", IFN: {interferon_amount:.2f}"
-
-            # Build final description
-            if input_summary and output_summary:
-                return f"Transition: {rule_name} ({input_summary} → {output_summary}{interferon_part})"
-            elif input_summary:
-                return f"Transition: {rule_name} ({input_summary}{interferon_part})"
-            else:
-                return f"Transition: {rule_name}{interferon_part}"
-
-        elif effect_type == "modify_transition":
-            rule_name = effect.get("rule_name", "Unknown")
-            modification = effect.get("modification", {})
-
-            # Check for modifications
-            prob_mult = modification.get("probability_multiplier", 1.0)
-            ifn_mult = modification.get("interferon_multiplier", 1.0)
-
-            mod_parts = []
-            if prob_mult != 1.0:
-                mod_parts.append(f"prob×{prob_mult:.1f}")
-            if ifn_mult != 1.0:
-                mod_parts.append(f"IFN×{ifn_mult:.2f}")
-
-            if mod_parts:
-                return f"Modify: {rule_name} ({', '.join(mod_parts)})"
-            else:
-                return f"Modify: {rule_name}"
-        else:
-            return f"Unknown: {effect_type}"
+        # Memoized by effect value: list refreshes re-format the same effect
+        # dicts over and over, and repr() of a small dict is much cheaper
+        # than the lookup/branch work below
+        key = repr(effect)
+        cached = self._effect_desc_cache.get(key)
+        if cached is None:
+            formatter = _EFFECT_FORMATTERS.get(effect.get("type"), _format_unknown_effect)
+            cached = self._effect_desc_cache[key] = formatter(effect)
+        return cached
 
     # =================== ALL EXISTING METHODS UPDATED WITH POLYMERASE SUPPORT ===================
 
     # MILESTONE EVENT HANDLERS
-    def on_milestone_select(self, event):
-        """Handle milestone selection"""
-        selection = self.milestone_listbox.curselection()
-        if not selection:
-            return
+    def on_milestone_select(self, event=None):
+        """Handle milestone selection (debounced)"""
+        self._debounce_selection("milestones", self._load_selected_milestone)
 
-        display_text = self.milestone_listbox.get(selection[0])
-        milestone_id = display_text.split(" (")[0]
-        self.load_milestone_data(milestone_id)
+    def _load_selected_milestone(self):
+        if not self._tab_built["milestones"]:
+            return  # Tab was torn down while the load was pending
 
-    def on_milestone_click(self, event):
-        """Handle milestone click"""
-        self.milestone_listbox.after(10, self.handle_milestone_selection)
-
-    def on_milestone_double_click(self, event):
-        """Handle milestone double-click"""
-        self.handle_milestone_selection()
-
-    def handle_milestone_selection(self):
-        """Common method to handle milestone selection"""
         selection = self.milestone_listbox.curselection()
         if not selection:
             return
 
-        display_text = self.milestone_listbox.get(selection[0])
-        milestone_id = display_text.split(" (")[0]
-        self.load_milestone_data(milestone_id)
+        self.load_milestone_data(self._milestone_ids_by_index[selection[0]])
 
     def on_milestone_type_change(self, event=None):
         """Handle milestone type change to update UI"""
-        milestone_type = self.milestone_type_var.get()
+        self._sync_class_enabled_state()
+
+    def _refresh_entity_class_values(self):
+        """Reload the entity-class dropdown choices.
+
+        Runs when the milestones tab is built and when entities change,
+        keeping the per-click load path free of database scans.
+        """
+        if not self._tab_built["milestones"]:
+            return
+        self.milestone_entity_class_combo['values'] = self.db_manager.get_entity_classes()
+
+    def _sync_class_enabled_state(self):
+        """Enable/disable the entity-class dropdown to match the selected type"""
+        milestone_type = self.milestone_type_combo.get()
 
-        # Update entity class combo availability and values
         if milestone_type in ["peak_entity_count", "cumulative_entity_count"]:
             # Enable entity class selection
             self.milestone_entity_class_combo.config(state="readonly")
-            entity_classes = self.db_manager.get_entity_classes()
-            self.milestone_entity_class_combo['values'] = entity_classes
-            if entity_classes and not self.milestone_entity_class_var.get():
-                self.milestone_entity_class_var.set(entity_classes[0])
+            values = self.milestone_entity_class_combo['values']
+            if values and not self.milestone_entity_class_combo.get():
+                self.milestone_entity_class_combo.set(values[0])
         else:
             # Disable entity class selection
             self.milestone_entity_class_combo.config(state="disabled")
-            self.milestone_entity_class_var.set("")
+            self.milestone_entity_class_combo.set("")
 
         # Update help text
         self.update_milestone_help_text(milestone_type)
@@ -4234,212 +4548,297 @@ class EditorModule(GameModule):
 
     def load_milestone_data(self, milestone_id):
         """Load milestone data into form"""
+        # Re-clicking the loaded row with no edits in between is a no-op
+        if (milestone_id == self.current_milestone_id
+                and self._loaded_milestone_version == self.db_manager._milestone_mutations):
+            return
+
         milestone = self.db_manager.get_milestone(milestone_id)
         if not milestone:
             return
 
         # Store reference for save operations
         self.current_milestone_id = milestone_id
+        self._loaded_milestone_version = self.db_manager._milestone_mutations
 
         # Simple status update
         self.milestone_status_label.config(text=f"Selected: {milestone_id}")
 
         # Load data directly
-        self.milestone_id_var.set(milestone.get("id", ""))
-        self.milestone_name_var.set(milestone.get("name", ""))
+        self._set_entry_text(self.milestone_id_entry, milestone.get("id", ""))
+        self._set_entry_text(self.milestone_name_entry, milestone.get("name", ""))
 
-        self.milestone_desc_text.delete(1.0, tk.END)
-        self.milestone_desc_text.insert(1.0, milestone.get("description", ""))
+        self._set_text_content(self.milestone_desc_text, milestone.get("description", ""))
 
-        self.milestone_type_var.set(milestone.get("type", "survive_turns"))
-        self.milestone_target_var.set(milestone.get("target", 5))
-        self.milestone_reward_var.set(milestone.get("reward_ep", 25))
-        self.milestone_entity_class_var.set(milestone.get("entity_class", ""))
+        self.milestone_type_combo.set(milestone.get("type", "survive_turns"))
+        self._set_entry_text(self.milestone_target_entry, milestone.get("target", 5))
+        self._set_entry_text(self.milestone_reward_entry, milestone.get("reward_ep", 25))
+        self.milestone_entity_class_combo.set(milestone.get("entity_class", ""))
 
         # Update UI based on type
         self.on_milestone_type_change()
 
     # ENTITY EVENT HANDLERS - CLEAN VERSION
-    def on_entity_select(self, event):
-        """Handle entity selection"""
-        selection = self.entity_listbox.curselection()
-        if not selection:
-            return
-
-        display_text = self.entity_listbox.get(selection[0])
-
-        # Parse entity name correctly - remove only the last parenthetical (degradation rate + starter indicator)
-        if " (" in display_text and display_text.endswith(")"):
-            last_paren = display_text.rfind(" (")
-            entity_name = display_text[:last_paren]
-        else:
-            entity_name = display_text
-
-        self.load_entity_data(entity_name)
-
-    def on_entity_click(self, event):
-        """Handle entity click"""
-        # Small delay to let selection register
-        self.entity_listbox.after(10, self.handle_entity_selection)
-
-    def on_entity_double_click(self, event):
-        """Handle entity double-click"""
-        self.handle_entity_selection()
-
-    def handle_entity_selection(self):
-        """Common method to handle entity selection"""
+    def _debounce_selection(self, key, load_selected):
+        """Schedule load_selected after SELECT_DEBOUNCE_MS, superseding any
+        pending load for the same list so only the last selection in a
+        burst actually hits the form-loading code."""
+        pending = self._select_after_ids.get(key)
+        if pending is not None:
+            self.frame.after_cancel(pending)
+        self._select_after_ids[key] = self.frame.after(
+            self.SELECT_DEBOUNCE_MS, lambda: self._fire_selection(key, load_selected))
+
+    def _fire_selection(self, key, load_selected):
+        self._select_after_ids[key] = None
+        load_selected()
+
+    def on_entity_select(self, event=None):
+        """Handle entity selection (debounced)"""
+        self._debounce_selection("entities", self._load_selected_entity)
+
+    def _load_selected_entity(self):
         selection = self.entity_listbox.curselection()
         if not selection:
             return
 
-        display_text = self.entity_listbox.get(selection[0])
-
-        # Parse entity name correctly - remove only the last parenthetical (degradation rate + starter indicator)
-        if " (" in display_text and display_text.endswith(")"):
-            last_paren = display_text.rfind(" (")
-            entity_name = display_text[:last_paren]
-        else:
-            entity_name = display_text
-
-        self.load_entity_data(entity_name)
+        # Rows are backed by _entity_names_by_index, so no display-text parsing
+        self.load_entity_data(self._entity_names_by_index[selection[0]])
 
     def load_entity_data(self, entity_name):
         """Load entity data into form - WITH STARTER SUPPORT"""
+        # Re-clicking the loaded row with no edits in between is a no-op
+        if (entity_name == self.current_entity_name
+                and self._loaded_entity_version == self.db_manager._entity_mutations):
+            return
+
         entity = self.db_manager.get_entity(entity_name)
         if not entity:
             return
 
         # Store reference for save operations
         self.current_entity_name = entity_name
+        self._loaded_entity_version = self.db_manager._entity_mutations
 
         # Simple status update
         self.entity_status_label.config(text=f"Selected: {entity_name}")
 
         # Load data directly
-        self.entity_name_var.set(entity.get("name", ""))
+        self._set_entry_text(self.entity_name_entry, entity.get("name", ""))
 
-        self.entity_desc_text.delete(1.0, tk.END)
-        self.entity_desc_text.insert(1.0, entity.get("description", ""))
+        self._set_text_content(self.entity_desc_text, entity.get("description", ""))
 
-        self.degradation_var.set(entity.get("base_degradation_rate", 0.05))
-        self.location_var.set(entity.get("location", ""))
-        self.entity_class_var.set(entity.get("entity_class", ""))
+        self._set_entry_text(self.degradation_entry, entity.get("base_degradation_rate", 0.05))
+        self.location_combo.set(entity.get("location", ""))
+        self.entity_class_combo.set(entity.get("entity_class", ""))
 
         # Load starter status
         self.is_starter_var.set(entity.get("is_starter", False))
 
     # GENE EVENT HANDLERS - UPDATED WITH POLYMERASE SUPPORT
-    def on_gene_select(self, event):
-        """Handle gene selection"""
-        selection = self.gene_listbox.curselection()
-        if not selection:
-            return
-
-        display_text = self.gene_listbox.get(selection[0])
-        gene_name = display_text.split(" (")[0]
-        self.load_gene_data(gene_name)
-
-    def on_gene_click(self, event):
-        """Handle gene click"""
-        self.gene_listbox.after(10, self.handle_gene_selection)
+    def on_gene_select(self, event=None):
+        """Handle gene selection (debounced)"""
+        self._debounce_selection("genes", self._load_selected_gene)
 
-    def on_gene_double_click(self, event):
-        """Handle gene double-click"""
-        self.handle_gene_selection()
+    def _load_selected_gene(self):
+        if not self._tab_built["genes"]:
+            return  # Tab was torn down while the load was pending
 
-    def handle_gene_selection(self):
-        """Common method to handle gene selection"""
         selection = self.gene_listbox.curselection()
         if not selection:
             return
 
-        display_text = self.gene_listbox.get(selection[0])
-        gene_name = display_text.split(" (")[0]
-        self.load_gene_data(gene_name)
+        self.load_gene_data(self._gene_names_by_index[selection[0]])
 
     def load_gene_data(self, gene_name):
         """Load gene data into form - UPDATED WITH POLYMERASE SUPPORT"""
+        # Re-clicking the loaded row with no edits in between is a no-op
+        if (gene_name == self.current_gene_name
+                and self._loaded_gene_version == self.db_manager._gene_mutations):
+            return
+
         gene = self.db_manager.get_gene(gene_name)
         if not gene:
             return
 
         # Store reference for save operations
         self.current_gene_name = gene_name
+        self._loaded_gene_version = self.db_manager._gene_mutations
 
         # Simple status update
         self.gene_status_label.config(text=f"Selected: {gene_name}")
 
         # Load data directly
-        self.gene_name_var.set(gene.get("name", ""))
-        self.gene_cost_var.set(gene.get("cost", 0))
+        self._set_entry_text(self.gene_name_entry, gene.get("name", ""))
+        self._set_entry_text(self.gene_cost_entry, gene.get("cost", 0))
 
-        self.gene_desc_text.delete(1.0, tk.END)
-        self.gene_desc_text.insert(1.0, gene.get("description", ""))
+        self._set_text_content(self.gene_desc_text, gene.get("description", ""))
 
-        # Load prerequisites
+        # Load prerequisites and effects in one insert call each
+        prereqs = gene.get("requires", [])
+        self._prereq_set = set(prereqs)
         self.prereq_listbox.delete(0, tk.END)
-        for req in gene.get("requires", []):
-            self.prereq_listbox.insert(tk.END, req)
+        if prereqs:
+            self.prereq_listbox.insert(tk.END, *prereqs)
 
-        # Load effects
+        effect_descs = [self.format_effect_description(effect)
+                        for effect in gene.get("effects", [])]
         self.effects_listbox.delete(0, tk.END)
-        for effect in gene.get("effects", []):
-            effect_desc = self.format_effect_description(effect)
-            self.effects_listbox.insert(tk.END, effect_desc)
+        if effect_descs:
+            self.effects_listbox.insert(tk.END, *effect_descs)
 
         # NEW: Load polymerase status
         self.is_polymerase_var.set(gene.get("is_polymerase", False))
 
+    def _request_change_notification(self):
+        """Notify the controller of a database change, at most once per
+        event-loop pass. Back-to-back edits (or a save that fires several
+        refreshes) collapse into a single handle_database_change call."""
+        if self._notify_pending or not hasattr(self.controller, 'handle_database_change'):
+            return
+        self._notify_pending = True
+        self.frame.after_idle(self._flush_change_notification)
+
+    def _flush_change_notification(self):
+        self._notify_pending = False
+        self.controller.handle_database_change()
+
+    @staticmethod
+    def _set_text_content(text_widget, value):
+        """Rewrite a Text widget only when its content actually changed.
+
+        Re-selecting the current row would otherwise delete+insert identical
+        text, forcing the widget through a full reflow; the compare is a
+        single get() call.
+        """
+        if text_widget.get(1.0, 'end-1c') != value:
+            text_widget.delete(1.0, tk.END)
+            text_widget.insert(1.0, value)
+
+    @staticmethod
+    def _set_entry_text(entry, value):
+        """Replace an Entry's content.
+
+        The form entries carry no Tk variables (a textvariable mirrors every
+        keystroke through a Tcl trace); values are written here on load and
+        read back with entry.get() on save.
+        """
+        entry.delete(0, tk.END)
+        entry.insert(0, value)
+
+    def _refresh_listbox(self, listbox, rows):
+        """Repopulate a listbox in one Tcl call, skipping unchanged content.
+
+        Inserting rows one at a time costs a Tcl roundtrip per row; a single
+        varargs insert is one roundtrip regardless of row count, and a
+        refresh whose rows match the last one shown is dropped entirely.
+        """
+        key = str(listbox)
+        previous = self._listbox_rows.get(key)
+        if previous == rows:
+            return
+        self._listbox_rows[key] = rows
+
+        if previous:
+            # Anchor matching rows at both ends and rewrite only the span
+            # between them: an in-place edit, insert or delete of a single
+            # row then costs one delete and one insert call
+            first_diff = 0
+            limit = min(len(previous), len(rows))
+            while first_diff < limit and previous[first_diff] == rows[first_diff]:
+                first_diff += 1
+            tail = 0
+            while (tail < limit - first_diff
+                   and previous[len(previous) - 1 - tail] == rows[len(rows) - 1 - tail]):
+                tail += 1
+            old_end = len(previous) - tail
+            if old_end > first_diff:
+                listbox.delete(first_diff, old_end - 1)
+            changed = rows[first_diff:len(rows) - tail]
+            if changed:
+                listbox.insert(first_diff, *changed)
+        else:
+            listbox.delete(0, tk.END)
+            if rows:
+                listbox.insert(tk.END, *rows)
+
     def update_entity_list(self):
         """Update the entity list - UPDATED TO SHOW STARTER STATUS"""
-        self.entity_listbox.delete(0, tk.END)
-
-        for entity_name in sorted(self.db_manager.get_all_entity_names()):
-            entity = self.db_manager.get_entity(entity_name)
+        version = self.db_manager._entity_mutations
+        if version == self._entity_list_version:
+            return
+        self._entity_list_version = version
+
+        rows = []
+        append = rows.append  # Local bind keeps the loop on LOAD_FAST
+        # Copy so the rows stay stable if the manager's cache mutates later
+        self._entity_names_by_index = names = list(self.db_manager.get_sorted_entity_names())
+        entities = self.db_manager.get_all_entities()
+        for entity_name in names:
+            entity = entities[entity_name]
             degradation = entity.get("base_degradation_rate", 0.05)
             is_starter = entity.get("is_starter", False)
 
             # Format: "Entity Name (degradation, starter)" or "Entity Name (degradation)"
             if is_starter:
-                display_text = f"{entity_name} ({degradation:.2f}, starter)"
+                append(f"{entity_name} ({degradation:.2f}, starter)")
             else:
-                display_text = f"{entity_name} ({degradation:.2f})"
+                append(f"{entity_name} ({degradation:.2f})")
 
-            self.entity_listbox.insert(tk.END, display_text)
+        self._refresh_listbox(self.entity_listbox, rows)
 
     def update_gene_list(self):
         """Update the gene list - UPDATED TO SHOW POLYMERASE STATUS"""
-        self.gene_listbox.delete(0, tk.END)
+        if not self._tab_built["genes"]:
+            return  # Tab refreshes itself when first built
 
-        for gene_name in sorted(self.db_manager.get_all_genes()):
-            gene = self.db_manager.get_gene(gene_name)
+        version = self.db_manager._gene_mutations
+        if version == self._gene_list_version:
+            return
+        self._gene_list_version = version
+
+        rows = []
+        append = rows.append  # Local bind keeps the loop on LOAD_FAST
+        # Copy so the rows stay stable if the manager's cache mutates later
+        self._gene_names_by_index = names = list(self.db_manager.get_sorted_gene_names())
+        genes = self.db_manager.database["genes"]
+        for gene_name in names:
+            gene = genes[gene_name]
             cost = gene.get("cost", 0)
             is_polymerase = gene.get("is_polymerase", False)
 
             # Format: "Gene Name (cost EP, Polymerase)" or "Gene Name (cost EP)"
             if is_polymerase:
-                display_text = f"{gene_name} ({cost} EP, Polymerase)"
+                append(f"{gene_name} ({cost} EP, Polymerase)")
             else:
-                display_text = f"{gene_name} ({cost} EP)"
+                append(f"{gene_name} ({cost} EP)")
 
-            self.gene_listbox.insert(tk.END, display_text)
+        self._refresh_listbox(self.gene_listbox, rows)
 
     # MILESTONE CRUD METHODS
     def save_milestone(self):
         """Save current milestone"""
+        # Numeric fields are plain Entries now, so parse them explicitly
+        try:
+            target = int(self.milestone_target_entry.get())
+            reward_ep = int(self.milestone_reward_entry.get())
+        except ValueError:
+            messagebox.showerror("Validation Error", "Target and Reward EP must be whole numbers")
+            return
+
         # Build milestone data from form
         milestone_data = {
-            "id": self.milestone_id_var.get().strip(),
-            "name": self.milestone_name_var.get().strip(),
+            "id": self.milestone_id_entry.get().strip(),
+            "name": self.milestone_name_entry.get().strip(),
             "description": self.milestone_desc_text.get(1.0, tk.END).strip(),
-            "type": self.milestone_type_var.get(),
-            "target": self.milestone_target_var.get(),
-            "reward_ep": self.milestone_reward_var.get()
+            "type": self.milestone_type_combo.get(),
+            "target": target,
+            "reward_ep": reward_ep
         }
 
         # Add entity_class if applicable
         if milestone_data["type"] in ["peak_entity_count", "cumulative_entity_count"]:
-            milestone_data["entity_class"] = self.milestone_entity_class_var.get()
+            milestone_data["entity_class"] = self.milestone_entity_class_combo.get()
 
         # Validate
         is_valid, error_msg = self.db_manager.validate_milestone_data(milestone_data)
@@ -4463,9 +4862,8 @@ class EditorModule(GameModule):
         self.update_database_display()
         self.milestone_status_label.config(text=f"Selected: {new_id} (Saved)")
 
-        # Notify controller of database change
-        if hasattr(self.controller, 'handle_database_change'):
-            self.controller.handle_database_change()
+        # Notify controller of database change (coalesced)
+        self._request_change_notification()
 
         messagebox.showinfo("Success", f"Milestone '{new_id}' saved")
 
@@ -4479,24 +4877,27 @@ class EditorModule(GameModule):
     def clear_milestone_form(self):
         """Clear the milestone form"""
         self.current_milestone_id = None
+        if not self._tab_built["milestones"]:
+            return  # Tab clears itself when first built
+
         self.milestone_status_label.config(text="No milestone selected")
-        self.milestone_id_var.set("")
-        self.milestone_name_var.set("")
+        self._set_entry_text(self.milestone_id_entry, "")
+        self._set_entry_text(self.milestone_name_entry, "")
         self.milestone_desc_text.delete(1.0, tk.END)
-        self.milestone_type_var.set("survive_turns")
-        self.milestone_target_var.set(5)
-        self.milestone_reward_var.set(25)
-        self.milestone_entity_class_var.set("")
+        self.milestone_type_combo.set("survive_turns")
+        self._set_entry_text(self.milestone_target_entry, 5)
+        self._set_entry_text(self.milestone_reward_entry, 25)
+        self.milestone_entity_class_combo.set("")
         self.on_milestone_type_change()
 
     def new_milestone(self):
         """Create a new milestone"""
         self.clear_milestone_form()
-        self.milestone_id_var.set("new_milestone")
-        self.milestone_name_var.set("New Milestone")
-        self.milestone_type_var.set("survive_turns")
-        self.milestone_target_var.set(5)
-        self.milestone_reward_var.set(25)
+        self._set_entry_text(self.milestone_id_entry, "new_milestone")
+        self._set_entry_text(self.milestone_name_entry, "New Milestone")
+        self.milestone_type_combo.set("survive_turns")
+        self._set_entry_text(self.milestone_target_entry, 5)
+        self._set_entry_text(self.milestone_reward_entry, 25)
         self.milestone_status_label.config(text="Creating new milestone")
         self.on_milestone_type_change()
 
@@ -4507,8 +4908,8 @@ class EditorModule(GameModule):
             return
 
         # Get current form data and modify ID
-        current_id = self.milestone_id_var.get()
-        self.milestone_id_var.set(f"{current_id}_copy")
+        current_id = self.milestone_id_entry.get()
+        self._set_entry_text(self.milestone_id_entry, f"{current_id}_copy")
         self.current_milestone_id = None  # Clear so it saves as new
         self.milestone_status_label.config(text="Cloning milestone")
 
@@ -4526,16 +4927,29 @@ class EditorModule(GameModule):
             self.update_database_display()
             self.clear_milestone_form()
 
-            # Notify controller of database change
-            if hasattr(self.controller, 'handle_database_change'):
-                self.controller.handle_database_change()
+            # Notify controller of database change (coalesced)
+            self._request_change_notification()
 
     def update_milestone_list(self):
         """Update the milestone list"""
-        self.milestone_listbox.delete(0, tk.END)
-
-        for milestone_id in sorted(self.db_manager.get_all_milestones()):
-            milestone = self.db_manager.get_milestone(milestone_id)
+        if not self._tab_built["milestones"]:
+            return  # Tab refreshes itself when first built
+
+        # Entity version rides along because the class dropdown below is
+        # refreshed from the entity table
+        version = (self.db_manager._milestone_mutations,
+                   self.db_manager._entity_mutations)
+        if version == self._milestone_list_version:
+            return
+        self._milestone_list_version = version
+
+        rows = []
+        append = rows.append  # Local bind keeps the loop on LOAD_FAST
+        # Copy so the rows stay stable if the manager's cache mutates later
+        self._milestone_ids_by_index = ids = list(self.db_manager.get_sorted_milestone_ids())
+        milestones = self.db_manager.database["milestones"]
+        for milestone_id in ids:
+            milestone = milestones[milestone_id]
             reward = milestone.get("reward_ep", 0)
             milestone_type = milestone.get("type", "unknown")
             target = milestone.get("target", 0)
@@ -4550,18 +4964,29 @@ class EditorModule(GameModule):
             else:
                 display_text = f"{milestone_id} ({reward} EP)"
 
-            self.milestone_listbox.insert(tk.END, display_text)
+            append(display_text)
+
+        self._refresh_listbox(self.milestone_listbox, rows)
+        # Entity edits route through here, so the class dropdown stays current
+        self._refresh_entity_class_values()
 
     # ENTITY CRUD METHODS - WITH STARTER SUPPORT
     def save_entity(self):
         """Save current entity - WITH STARTER SUPPORT"""
+        # Degradation rate is a plain Entry now, so parse it explicitly
+        try:
+            degradation_rate = float(self.degradation_entry.get())
+        except ValueError:
+            messagebox.showerror("Error", "Degradation rate must be a number between 0.0 and 1.0")
+            return
+
         # Build entity data from form
         entity_data = {
-            "name": self.entity_name_var.get().strip(),
+            "name": self.entity_name_entry.get().strip(),
             "description": self.entity_desc_text.get(1.0, tk.END).strip(),
-            "base_degradation_rate": self.degradation_var.get(),
-            "location": self.location_var.get(),
-            "entity_class": self.entity_class_var.get(),
+            "base_degradation_rate": degradation_rate,
+            "location": self.location_combo.get(),
+            "entity_class": self.entity_class_combo.get(),
             "is_starter": self.is_starter_var.get()  # Include starter status
         }
 
@@ -4604,20 +5029,20 @@ class EditorModule(GameModule):
         """Clear the entity form - WITH STARTER SUPPORT"""
         self.current_entity_name = None
         self.entity_status_label.config(text="No entity selected")
-        self.entity_name_var.set("")
+        self._set_entry_text(self.entity_name_entry, "")
         self.entity_desc_text.delete(1.0, tk.END)
-        self.degradation_var.set(0.05)
-        self.location_var.set("")
-        self.entity_class_var.set("")
+        self._set_entry_text(self.degradation_entry, 0.05)
+        self.location_combo.set("")
+        self.entity_class_combo.set("")
         self.is_starter_var.set(False)  # Reset starter checkbox
 
     def new_entity(self):
         """Create a new entity - WITH STARTER SUPPORT"""
         self.clear_entity_form()
-        self.entity_name_var.set("New Entity")
-        self.degradation_var.set(0.05)
-        self.location_var.set("unknown")
-        self.entity_class_var.set("unknown")
+        self._set_entry_text(self.entity_name_entry, "New Entity")
+        self._set_entry_text(self.degradation_entry, 0.05)
+        self.location_combo.set("unknown")
+        self.entity_class_combo.set("unknown")
         self.is_starter_var.set(False)  # Default to non-starter
         self.entity_status_label.config(text="Creating new entity")
 
@@ -4628,8 +5053,8 @@ class EditorModule(GameModule):
             return
 
         # Get current form data and modify name
-        current_name = self.entity_name_var.get()
-        self.entity_name_var.set(f"{current_name} (Copy)")
+        current_name = self.entity_name_entry.get()
+        self._set_entry_text(self.entity_name_entry, f"{current_name} (Copy)")
         self.current_entity_name = None  # Clear so it saves as new
         self.entity_status_label.config(text="Cloning entity")
 
@@ -4641,25 +5066,12 @@ class EditorModule(GameModule):
 
         entity_name = self.current_entity_name
 
-        # Check if entity is used in genes
-        used_in_genes = []
-        for gene_name, gene_data in self.db_manager.database["genes"].items():
-            for effect in gene_data.get("effects", []):
-                if (effect["type"] == "enable_entity" and effect.get("entity") == entity_name) or \
-                        (effect["type"] in ["add_transition"]):
-                    rule = effect.get("rule", {})
-                    for input_spec in rule.get("inputs", []):
-                        if input_spec["entity"] == entity_name:
-                            used_in_genes.append(gene_name)
-                            break
-                    for output_spec in rule.get("outputs", []):
-                        if output_spec["entity"] == entity_name:
-                            used_in_genes.append(gene_name)
-                            break
+        # Check if entity is used in genes (reverse index, no gene scan)
+        used_in_genes = self.db_manager.get_genes_referencing_entity(entity_name)
 
         if used_in_genes:
             messagebox.showerror("Cannot Delete",
-                                 f"Entity '{entity_name}' is used in genes: {', '.join(set(used_in_genes))}\n"
+                                 f"Entity '{entity_name}' is used in genes: {', '.join(sorted(used_in_genes))}\n"
                                  f"Remove it from these genes first.")
             return
 
@@ -4673,10 +5085,17 @@ class EditorModule(GameModule):
     # GENE CRUD METHODS - UPDATED WITH POLYMERASE SUPPORT
     def save_gene(self):
         """Save current gene - UPDATED WITH POLYMERASE SUPPORT"""
+        # Cost is a plain Entry now, so parse it explicitly
+        try:
+            cost = int(self.gene_cost_entry.get())
+        except ValueError:
+            messagebox.showerror("Error", "Gene cost must be a whole number")
+            return
+
         # Build gene data from form
         gene_data = {
-            "name": self.gene_name_var.get().strip(),
-            "cost": self.gene_cost_var.get(),
+            "name": self.gene_name_entry.get().strip(),
+            "cost": cost,
             "description": self.gene_desc_text.get(1.0, tk.END).strip(),
             "effects": [],
             "is_polymerase": self.is_polymerase_var.get()  # NEW: Include polymerase status
@@ -4687,10 +5106,8 @@ class EditorModule(GameModule):
             messagebox.showerror("Error", "Gene name cannot be empty")
             return
 
-        # Add prerequisites if any
-        prereqs = []
-        for i in range(self.prereq_listbox.size()):
-            prereqs.append(self.prereq_listbox.get(i))
+        # Add prerequisites if any (one Tcl call for the whole column)
+        prereqs = list(self.prereq_listbox.get(0, tk.END))
         if prereqs:
             gene_data["requires"] = prereqs
 
@@ -4710,6 +5127,9 @@ class EditorModule(GameModule):
         # Save
         self.db_manager.add_gene(gene_data)
         self.current_gene_name = new_name
+        # Edited effects may orphan cached descriptions; drop them so the
+        # memo stays bounded by the live effect population
+        self._effect_desc_cache.clear()
 
         # Update displays
         self.update_gene_list()
@@ -4728,10 +5148,14 @@ class EditorModule(GameModule):
     def clear_gene_form(self):
         """Clear the gene form - UPDATED WITH POLYMERASE SUPPORT"""
         self.current_gene_name = None
+        if not self._tab_built["genes"]:
+            return  # Tab clears itself when first built
+
         self.gene_status_label.config(text="No gene selected")
-        self.gene_name_var.set("")
-        self.gene_cost_var.set(0)
+        self._set_entry_text(self.gene_name_entry, "")
+        self._set_entry_text(self.gene_cost_entry, 0)
         self.gene_desc_text.delete(1.0, tk.END)
+        self._prereq_set = set()
         self.prereq_listbox.delete(0, tk.END)
         self.effects_listbox.delete(0, tk.END)
         self.is_polymerase_var.set(False)  # NEW: Reset polymerase checkbox
@@ -4739,8 +5163,8 @@ class EditorModule(GameModule):
     def new_gene(self):
         """Create a new gene - UPDATED WITH POLYMERASE SUPPORT"""
         self.clear_gene_form()
-        self.gene_name_var.set("New Gene")
-        self.gene_cost_var.set(0)
+        self._set_entry_text(self.gene_name_entry, "New Gene")
+        self._set_entry_text(self.gene_cost_entry, 0)
         self.is_polymerase_var.set(False)  # NEW: Default to non-polymerase
         self.gene_status_label.config(text="Creating new gene")
 
@@ -4751,8 +5175,8 @@ class EditorModule(GameModule):
             return
 
         # Get current form data and modify name
-        current_name = self.gene_name_var.get()
-        self.gene_name_var.set(f"{current_name} (Copy)")
+        current_name = self.gene_name_entry.get()
+        self._set_entry_text(self.gene_name_entry, f"{current_name} (Copy)")
         self.current_gene_name = None  # Clear so it saves as new
         self.gene_status_label.config(text="Cloning gene")
 
@@ -4766,6 +5190,7 @@ class EditorModule(GameModule):
 
         if messagebox.askyesno("Confirm Delete", f"Delete gene '{gene_name}'?"):
             self.db_manager.delete_gene(gene_name)
+            self._effect_desc_cache.clear()
             self.update_gene_list()
             self.update_database_display()
             self.clear_gene_form()
@@ -4774,7 +5199,7 @@ class EditorModule(GameModule):
         """Add prerequisite gene"""
         # Get available genes
         available_genes = [name for name in self.db_manager.get_all_genes()
-                           if name != self.gene_name_var.get()]
+                           if name != self.gene_name_entry.get()]
 
         if not available_genes:
             messagebox.showinfo("No Genes", "No other genes available as prerequisites")
@@ -4783,10 +5208,10 @@ class EditorModule(GameModule):
         # Simple selection dialog
         prereq = simpledialog.askstring("Add Prerequisite",
                                         f"Available genes: {', '.join(available_genes)}\n\nEnter prerequisite gene name:")
-        if prereq and prereq in available_genes:
-            # Check if already in list
-            current_prereqs = [self.prereq_listbox.get(i) for i in range(self.prereq_listbox.size())]
-            if prereq not in current_prereqs:
+        if prereq and prereq in set(available_genes):
+            # The set mirror makes the already-added check O(1)
+            if prereq not in self._prereq_set:
+                self._prereq_set.add(prereq)
                 self.prereq_listbox.insert(tk.END, prereq)
             else:
                 messagebox.showinfo("Already Added", f"'{prereq}' is already a prerequisite")
@@ -4797,6 +5222,7 @@ class EditorModule(GameModule):
         """Remove prerequisite gene"""
         selection = self.prereq_listbox.curselection()
         if selection:
+            self._prereq_set.discard(self.prereq_listbox.get(selection[0]))
             self.prereq_listbox.delete(selection[0])
 
     def add_effect(self):
@@ -4831,17 +5257,13 @@ class EditorModule(GameModule):
         effect_index = selection[0]
         gene = self.db_manager.get_gene(self.current_gene_name)
         if gene and effect_index < len(gene.get("effects", [])):
-            # Remove effect and update gene
+            # Remove effect and update the stored gene in place
             gene_effects = gene.get("effects", [])
             del gene_effects[effect_index]
+            self.db_manager.update_gene_effects(self.current_gene_name, gene_effects)
 
-            # Update gene in database
-            updated_gene = gene.copy()
-            updated_gene["effects"] = gene_effects
-            self.db_manager.add_gene(updated_gene)
-
-            # Refresh effects display
-            self.load_gene_data(self.current_gene_name)
+            # Only the effects column changed; leave the rest of the form alone
+            self._refresh_effects_listbox()
 
     def on_effect_select(self, event):
         """Handle effect selection"""
@@ -4849,7 +5271,8 @@ class EditorModule(GameModule):
 
     def open_effect_editor(self, effect=None, effect_index=None):
         """Open effect editor dialog"""
-        dialog = EffectEditorDialog(self.frame, effect, self.db_manager.get_all_entity_names())
+        dialog = EffectEditorDialog(self.frame, effect, self.db_manager.get_all_entity_names(),
+                                    screen_size=getattr(self.controller, 'screen_size', None))
         self.frame.wait_window(dialog.dialog)
 
         if dialog.result and hasattr(self, 'current_gene_name') and self.current_gene_name:
@@ -4868,13 +5291,18 @@ class EditorModule(GameModule):
                 # Add new effect
                 effects.append(dialog.result)
 
-            # Update gene in database
-            updated_gene = gene.copy()
-            updated_gene["effects"] = effects
-            self.db_manager.add_gene(updated_gene)
+            # Update the stored gene in place and refresh just the effects
+            self.db_manager.update_gene_effects(self.current_gene_name, effects)
+            self._refresh_effects_listbox()
 
-            # Refresh display
-            self.load_gene_data(self.current_gene_name)
+    def _refresh_effects_listbox(self):
+        """Repopulate the effects list for the current gene"""
+        gene = self.db_manager.get_gene(self.current_gene_name)
+        effect_descs = [self.format_effect_description(effect)
+                        for effect in gene.get("effects", [])] if gene else []
+        self.effects_listbox.delete(0, tk.END)
+        if effect_descs:
+            self.effects_listbox.insert(tk.END, *effect_descs)
 
     # DATABASE METHODS - UPDATED WITH MILESTONE COUNT
     def new_database(self):
@@ -4887,6 +5315,24 @@ class EditorModule(GameModule):
                 return
 
         self.db_manager = GeneDatabaseManager()
+        self._refresh_all_views()
+
+    def _refresh_all_views(self):
+        """Full refresh after the database has been swapped or reloaded.
+
+        Cached render versions are dropped first: a fresh manager restarts
+        its mutation counters, so a stale version match must not suppress
+        the rebuild.
+        """
+        self._entity_list_version = None
+        self._gene_list_version = None
+        self._milestone_list_version = None
+        self._db_display_version = None
+        self._loaded_entity_version = None
+        self._loaded_gene_version = None
+        self._loaded_milestone_version = None
+        self._effect_desc_cache.clear()
+
         self.update_database_display()
         self.update_entity_list()
         self.update_gene_list()
@@ -4913,17 +5359,10 @@ class EditorModule(GameModule):
         if file_path:
             try:
                 self.db_manager.load_database(file_path)
-                self.update_database_display()
-                self.update_entity_list()
-                self.update_gene_list()
-                self.update_milestone_list()
-                self.clear_entity_form()
-                self.clear_gene_form()
-                self.clear_milestone_form()
+                self._refresh_all_views()
 
-                # Notify controller of database change
-                if hasattr(self.controller, 'handle_database_change'):
-                    self.controller.handle_database_change()
+                # Notify controller of database change (coalesced)
+                self._request_change_notification()
 
                 messagebox.showinfo("Success",
                                     f"Loaded database with {len(self.db_manager.get_all_genes())} genes, "
@@ -4944,9 +5383,8 @@ class EditorModule(GameModule):
             self.db_manager.save_database()
             self.update_database_display()
 
-            # Notify controller of database change
-            if hasattr(self.controller, 'handle_database_change'):
-                self.controller.handle_database_change()
+            # Notify controller of database change (coalesced)
+            self._request_change_notification()
 
             messagebox.showinfo("Success", "Database saved successfully")
         except Exception as e:
@@ -4968,9 +5406,8 @@ class EditorModule(GameModule):
                 self.db_manager.save_database(file_path)
                 self.update_database_display()
 
-                # Notify controller of database change
-                if hasattr(self.controller, 'handle_database_change'):
-                    self.controller.handle_database_change()
+                # Notify controller of database change (coalesced)
+                self._request_change_notification()
 
                 messagebox.showinfo("Success", f"Database saved as {os.path.basename(file_path)}")
             except Exception as e:
@@ -4978,78 +5415,152 @@ class EditorModule(GameModule):
 
     def update_database_display(self):
         """Update database info display - WITH MILESTONE COUNT"""
+        version = (self.db_manager._entity_mutations,
+                   self.db_manager._gene_mutations,
+                   self.db_manager._milestone_mutations,
+                   self.db_manager.is_modified,
+                   self.db_manager.file_path)
+        if version == self._db_display_version:
+            return
+        self._db_display_version = version
+
         db_info = self.db_manager.database["database_info"]
 
-        self.db_name_var.set(db_info.get("name", ""))
-        self.db_version_var.set(db_info.get("version", ""))
+        self._set_entry_text(self.db_name_entry, db_info.get("name", ""))
+        self._set_entry_text(self.db_version_entry, db_info.get("version", ""))
+
+        self._set_entry_text(self.db_desc_entry, db_info.get("description", ""))
 
-        self.db_desc_text.delete(1.0, tk.END)
-        self.db_desc_text.insert(1.0, db_info.get("description", ""))
+        # Status - updated to show milestone count. Counts come straight off
+        # the backing dicts and the cached starter/polymerase lists, computed
+        # once for either branch of the header
+        gene_count = len(self.db_manager.database["genes"])
+        entity_count = len(self.db_manager.database["entities"])
+        starter_count = len(self.db_manager.get_starter_entities())
+        milestone_count = len(self.db_manager.database["milestones"])
+        polymerase_count = len(self.db_manager.get_polymerase_genes())
+        modified = " *" if self.db_manager.is_modified else ""
 
-        # Status - updated to show milestone count
         if self.db_manager.file_path:
-            filename = os.path.basename(self.db_manager.file_path)
-            gene_count = len(self.db_manager.get_all_genes())
-            entity_count = len(self.db_manager.get_all_entity_names())
-            starter_count = len(self.db_manager.get_starter_entities())
-            milestone_count = len(self.db_manager.get_all_milestones())
-            polymerase_count = len(self.db_manager.get_polymerase_genes())  # NEW: Show polymerase count
-            modified = " *" if self.db_manager.is_modified else ""
-            self.status_label.config(
-                text=f"File: {filename} | {gene_count} genes ({polymerase_count} polymerase), {entity_count} entities "
-                     f"({starter_count} starters), {milestone_count} milestones{modified}")
+            source = f"File: {os.path.basename(self.db_manager.file_path)}"
         else:
-            gene_count = len(self.db_manager.get_all_genes())
-            entity_count = len(self.db_manager.get_all_entity_names())
-            starter_count = len(self.db_manager.get_starter_entities())
-            milestone_count = len(self.db_manager.get_all_milestones())
-            polymerase_count = len(self.db_manager.get_polymerase_genes())  # NEW: Show polymerase count
-            modified = " *" if self.db_manager.is_modified else ""
-            self.status_label.config(
-                text=f"New database | {gene_count} genes ({polymerase_count} polymerase), {entity_count} entities "
-                     f"({starter_count} starters), {milestone_count} milestones{modified}")
+            source = "New database"
+        self.status_label.config(
+            text=f"{source} | {gene_count} genes ({polymerase_count} polymerase), {entity_count} entities "
+                 f"({starter_count} starters), {milestone_count} milestones{modified}")
 
     def update_database_info_from_ui(self):
         """Update database info from UI fields"""
         db_info = self.db_manager.database["database_info"]
-        db_info["name"] = self.db_name_var.get()
-        db_info["version"] = self.db_version_var.get()
-        db_info["description"] = self.db_desc_text.get(1.0, tk.END).strip()
+        db_info["name"] = self.db_name_entry.get()
+        db_info["version"] = self.db_version_entry.get()
+        db_info["description"] = self.db_desc_entry.get().strip()
+
+
+# The stock ttk separator tiles a 1x1 source image across its width, which
+# makes every reflow of the scrollable effect frame pay one blit per pixel.
+# A wide source image cuts that roughly 40-fold. Registered once per app;
+# the image reference is kept here so Tk doesn't garbage-collect it.
+_wide_separator_img = None
+
+
+def _ensure_wide_separator_style(widget):
+    """Register the Wide.TSeparator style on the widget's interpreter"""
+    global _wide_separator_img
+    if _wide_separator_img is not None:
+        return
+    img = tk.PhotoImage(width=40, height=2, master=widget)
+    img.put("#c3c3c3", to=(0, 0, 40, 2))
+    style = ttk.Style(widget)
+    style.element_create("Wide.hseparator", "image", img)
+    style.layout("Wide.TSeparator", [("Wide.hseparator", {"sticky": "ew"})])
+    _wide_separator_img = img
+
+
+# Mouse-wheel routing: one application-wide binding instead of three
+# per-canvas binds. Whichever scrollable canvas is currently on screen
+# registers itself as the target; events route to it in O(1).
+_active_scroll_canvas = None
+_wheel_routing_installed = False
+
+
+def _set_active_scroll_canvas(canvas):
+    """Make the given canvas (or None) the wheel-scroll target"""
+    global _active_scroll_canvas
+    _active_scroll_canvas = canvas
+
+
+def _ensure_wheel_routing(widget):
+    """Install the app-wide mouse-wheel bindings once"""
+    global _wheel_routing_installed
+    if _wheel_routing_installed:
+        return
+
+    def _scroll(units):
+        canvas = _active_scroll_canvas
+        if canvas is not None and canvas.winfo_exists():
+            canvas.yview_scroll(units, "units")
+
+    widget.bind_all("<MouseWheel>",
+                    lambda e: _scroll(int(-1 * (e.delta / 120))))  # Windows
+    widget.bind_all("<Button-4>", lambda e: _scroll(-1))  # Linux
+    widget.bind_all("<Button-5>", lambda e: _scroll(1))  # Linux
+    _wheel_routing_installed = True
 
 
 class EffectEditorDialog:
     """Dialog for editing gene effects - UPDATED TO SUPPORT INTERFERON EFFECTS"""
 
-    def __init__(self, parent, effect=None, available_entities=None):
+    def __init__(self, parent, effect=None, available_entities=None, screen_size=None):
         self.result = None
         self.available_entities = available_entities or []
+        # One shared values tuple for all six entity comboboxes, built once
+        # instead of each widget copying the list during configure
+        self._entity_values = tuple(self.available_entities)
 
-        # Create dialog window
+        # Create dialog window. Centering uses screen metrics only, so no
+        # update_idletasks round-trip is needed before placing it.
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Effect Editor")
-        self.dialog.geometry("700x650")  # Increased height for interferon fields
         self.dialog.transient(parent)
-        self.dialog.grab_set()
-
-        # Center the dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (700 // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (650 // 2)
-        self.dialog.geometry(f"700x650+{x}+{y}")
+        if screen_size is None:
+            screen_size = (self.dialog.winfo_screenwidth(), self.dialog.winfo_screenheight())
+        x = (screen_size[0] // 2) - (700 // 2)
+        y = (screen_size[1] // 2) - (650 // 2)
+        self.dialog.geometry(f"700x650+{x}+{y}")  # Height allows for interferon fields
+
+        # Builders for the type-specific frames; each is constructed at most
+        # once and cached, then shown/hidden on type change
+        self._type_builders = {
+            "add_transition": self.setup_add_transition_ui,
+            "modify_transition": self.setup_modify_transition_ui,
+        }
+        self._type_frames = {}
+        self._current_type_frame = None
 
         self.setup_ui(effect)
 
+        # Grab only once the dialog is populated; grabbing first would
+        # block the caller's event processing during widget construction
+        self.dialog.grab_set()
+
     def setup_ui(self, effect):
         """Setup the effect editor UI"""
+        # The four top-level sections are placed with grid in one column;
+        # Tk then solves the dialog layout once at idle instead of running
+        # a pack relayout per section
+        self.dialog.columnconfigure(0, weight=1)
+        self.dialog.rowconfigure(2, weight=1)
+
         # Header
         header_frame = ttk.Frame(self.dialog)
-        header_frame.pack(fill=tk.X, padx=10, pady=10)
+        header_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
 
         ttk.Label(header_frame, text="Edit Gene Effect", font=("Arial", 14, "bold")).pack()
 
         # Effect type selection
         type_frame = ttk.LabelFrame(self.dialog, text="Effect Type", padding=10)
-        type_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+        type_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=(0, 10))
 
         self.effect_type_var = tk.StringVar()
         self.effect_type_var.trace('w', self.on_effect_type_change)
@@ -5065,11 +5576,11 @@ class EffectEditorDialog:
 
         # Dynamic content area
         self.content_frame = ttk.Frame(self.dialog)
-        self.content_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        self.content_frame.grid(row=2, column=0, sticky="nsew", padx=10, pady=(0, 10))
 
         # Buttons
         button_frame = ttk.Frame(self.dialog)
-        button_frame.pack(fill=tk.X, padx=10, pady=10)
+        button_frame.grid(row=3, column=0, sticky="ew", padx=10, pady=10)
 
         ttk.Button(button_frame, text="OK", command=self.ok_clicked).pack(side=tk.RIGHT, padx=(5, 0))
         ttk.Button(button_frame, text="Cancel", command=self.cancel_clicked).pack(side=tk.RIGHT)
@@ -5083,10 +5594,11 @@ class EffectEditorDialog:
     def load_effect(self, effect):
         """Load existing effect data"""
         effect_type = effect.get("type", "add_transition")
-        self.effect_type_var.set(effect_type)
 
-        # The UI will be updated by the trace callback
-        self.dialog.after(100, lambda: self.populate_fields(effect))
+        # Setting the type builds/shows its frame synchronously through the
+        # trace callback, so the fields exist by the time they're populated
+        self.effect_type_var.set(effect_type)
+        self.populate_fields(effect)
 
     def populate_fields(self, effect):
         """Populate fields with effect data - UPDATED FOR INTERFERON SUPPORT"""
@@ -5099,32 +5611,23 @@ class EffectEditorDialog:
                 self.probability_var.set(int(rule.get("probability", 0.5) * 100))
                 self.rule_type_var.set(rule.get("rule_type", "per_entity"))
 
-                # Load inputs (up to 3)
+                # Load inputs (up to 3), clearing unused rows as we go
                 inputs = rule.get("inputs", [])
-                for i in range(3):
-                    if i < len(inputs):
-                        input_data = inputs[i]
-                        self.input_entity_vars[i].set(input_data["entity"])
-                        self.input_count_vars[i].set(input_data["count"])
-                        # Set consumed status from first input (since it's all-or-nothing)
-                        if i == 0:
-                            self.input_consumed_var.set(input_data.get("consumed", True))
-                    else:
-                        # Clear unused input fields
-                        self.input_entity_vars[i].set("")
-                        self.input_count_vars[i].set(1)
+                for entity_var, count_var, input_data in zip_longest(
+                        self.input_entity_vars, self.input_count_vars, inputs[:3]):
+                    entity_var.set(input_data["entity"] if input_data else "")
+                    count_var.set(input_data["count"] if input_data else 1)
+
+                # Consumed status comes from the first input (all-or-nothing)
+                if inputs:
+                    self.input_consumed_var.set(inputs[0].get("consumed", True))
 
                 # Load outputs (up to 3)
                 outputs = rule.get("outputs", [])
-                for i in range(3):
-                    if i < len(outputs):
-                        output_data = outputs[i]
-                        self.output_entity_vars[i].set(output_data["entity"])
-                        self.output_count_vars[i].set(output_data["count"])
-                    else:
-                        # Clear unused output fields
-                        self.output_entity_vars[i].set("")
-                        self.output_count_vars[i].set(1)
+                for entity_var, count_var, output_data in zip_longest(
+                        self.output_entity_vars, self.output_count_vars, outputs[:3]):
+                    entity_var.set(output_data["entity"] if output_data else "")
+                    count_var.set(output_data["count"] if output_data else 1)
 
                 # NEW: Load interferon data
                 interferon_amount = rule.get("interferon_amount", 0.0)
@@ -5150,35 +5653,31 @@ class EffectEditorDialog:
 
     def on_effect_type_change(self, *args):
         """Handle effect type change"""
-        # Clear current content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+        # Hide the current frame rather than destroying it; repeat toggles
+        # then cost a pack call instead of a full teardown and rebuild
+        if self._current_type_frame is not None:
+            self._current_type_frame.pack_forget()
+            self._current_type_frame = None
 
         effect_type = self.effect_type_var.get()
+        frame = self._type_frames.get(effect_type)
+        if frame is None:
+            build_frame = self._type_builders.get(effect_type)
+            if build_frame is None:
+                return
+            frame = self._type_frames[effect_type] = build_frame()
 
-        if effect_type == "add_transition":
-            self.setup_add_transition_ui()
-        elif effect_type == "modify_transition":
-            self.setup_modify_transition_ui()
+        frame.pack(fill=tk.BOTH, expand=True)
+        self._current_type_frame = frame
 
     def setup_add_transition_ui(self):
-        """Setup UI for add transition effect - UPDATED FOR INTERFERON SUPPORT"""
-        # Create scrollable frame for the content
-        canvas = tk.Canvas(self.content_frame)
-        scrollbar = ttk.Scrollbar(self.content_frame, orient=tk.VERTICAL, command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        # Pack scrollbar and canvas
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        """Build the add-transition frame (once) - UPDATED FOR INTERFERON SUPPORT"""
+        # Everything lives in a container the type-change handler packs.
+        # The content is built into a plain frame first; the scrollable
+        # canvas is only allocated afterwards if the content doesn't fit
+        _ensure_wide_separator_style(self.dialog)
+        container = ttk.Frame(self.content_frame)
+        scrollable_frame = ttk.Frame(container)
 
         # Main frame for rule content
         frame = ttk.LabelFrame(scrollable_frame, text="Add Transition Rule", padding=10)
@@ -5204,9 +5703,21 @@ class EffectEditorDialog:
         prob_label = ttk.Label(prob_frame, text="50%")
         prob_label.pack(side=tk.LEFT, padx=(5, 0))
 
-        def update_prob_label(*args):
+        # The trace fires for every pixel of a slider drag; coalesce label
+        # rewrites to one per idle pass so dragging doesn't flood the
+        # event loop with config calls
+        self._prob_label_pending = False
+
+        def _apply_prob_label():
+            self._prob_label_pending = False
             prob_label.config(text=f"{self.probability_var.get()}%")
 
+        def update_prob_label(*args):
+            if self._prob_label_pending:
+                return
+            self._prob_label_pending = True
+            self.dialog.after_idle(_apply_prob_label)
+
         self.probability_var.trace('w', update_prob_label)
         current_row += 1
 
@@ -5222,7 +5733,8 @@ class EffectEditorDialog:
         current_row += 1
 
         # Separator
-        ttk.Separator(frame, orient=tk.HORIZONTAL).grid(row=current_row, column=0, columnspan=4, sticky="ew", pady=15)
+        ttk.Separator(frame, orient=tk.HORIZONTAL, style="Wide.TSeparator").grid(
+            row=current_row, column=0, columnspan=4, sticky="ew", pady=15)
         current_row += 1
 
         # INPUT ENTITIES SECTION
@@ -5231,36 +5743,21 @@ class EffectEditorDialog:
         current_row += 1
 
         # Headers for input section
-        ttk.Label(frame, text="Entity", font=("Arial", 9, "bold")).grid(row=current_row, column=0, sticky=tk.W,
-                                                                        padx=(0, 10))
-        ttk.Label(frame, text="Count", font=("Arial", 9, "bold")).grid(row=current_row, column=1, sticky=tk.W,
-                                                                       padx=(0, 10))
-        ttk.Label(frame, text="Notes", font=("Arial", 9, "bold")).grid(row=current_row, column=2, sticky=tk.W)
+        self._make_entity_header(frame).grid(row=current_row, column=0, columnspan=4, sticky=tk.W)
         current_row += 1
 
-        # Create 3 input entity rows
+        # Create 3 input entity rows, each a composite frame placed with a
+        # single grid call
         self.input_entity_vars = []
         self.input_count_vars = []
 
         for i in range(3):
-            # Entity dropdown
             input_entity_var = tk.StringVar()
             self.input_entity_vars.append(input_entity_var)
-            input_combo = ttk.Combobox(frame, textvariable=input_entity_var, values=self.available_entities, width=25)
-            input_combo.grid(row=current_row, column=0, sticky=tk.W, padx=(0, 10), pady=2)
-
-            # Count entry
             input_count_var = tk.IntVar(value=1)
             self.input_count_vars.append(input_count_var)
-            ttk.Entry(frame, textvariable=input_count_var, width=8).grid(row=current_row, column=1, sticky=tk.W,
-                                                                         padx=(0, 10), pady=2)
-
-            # Notes for first row only
-            if i == 0:
-                ttk.Label(frame, text="(Leave entity blank to skip row)", font=("Arial", 8, "italic"),
-                          foreground="gray").grid(
-                    row=current_row, column=2, sticky=tk.W, pady=2)
-
+            self._make_entity_row(frame, input_entity_var, input_count_var, i == 0).grid(
+                row=current_row, column=0, columnspan=4, sticky=tk.W, pady=2)
             current_row += 1
 
         # Consumed checkbox (applies to all inputs)
@@ -5271,7 +5768,8 @@ class EffectEditorDialog:
         current_row += 1
 
         # Separator
-        ttk.Separator(frame, orient=tk.HORIZONTAL).grid(row=current_row, column=0, columnspan=4, sticky="ew", pady=15)
+        ttk.Separator(frame, orient=tk.HORIZONTAL, style="Wide.TSeparator").grid(
+            row=current_row, column=0, columnspan=4, sticky="ew", pady=15)
         current_row += 1
 
         # OUTPUT ENTITIES SECTION
@@ -5280,41 +5778,26 @@ class EffectEditorDialog:
         current_row += 1
 
         # Headers for output section
-        ttk.Label(frame, text="Entity", font=("Arial", 9, "bold")).grid(row=current_row, column=0, sticky=tk.W,
-                                                                        padx=(0, 10))
-        ttk.Label(frame, text="Count", font=("Arial", 9, "bold")).grid(row=current_row, column=1, sticky=tk.W,
-                                                                       padx=(0, 10))
-        ttk.Label(frame, text="Notes", font=("Arial", 9, "bold")).grid(row=current_row, column=2, sticky=tk.W)
+        self._make_entity_header(frame).grid(row=current_row, column=0, columnspan=4, sticky=tk.W)
         current_row += 1
 
-        # Create 3 output entity rows
+        # Create 3 output entity rows (composite frames, one grid call each)
         self.output_entity_vars = []
         self.output_count_vars = []
 
         for i in range(3):
-            # Entity dropdown
             output_entity_var = tk.StringVar()
             self.output_entity_vars.append(output_entity_var)
-            output_combo = ttk.Combobox(frame, textvariable=output_entity_var, values=self.available_entities, width=25)
-            output_combo.grid(row=current_row, column=0, sticky=tk.W, padx=(0, 10), pady=2)
-
-            # Count entry
             output_count_var = tk.IntVar(value=1)
             self.output_count_vars.append(output_count_var)
-            ttk.Entry(frame, textvariable=output_count_var, width=8).grid(row=current_row, column=1, sticky=tk.W,
-                                                                          padx=(0, 10), pady=2)
-
-            # Notes for first row only
-            if i == 0:
-                ttk.Label(frame, text="(Leave entity blank to skip row)", font=("Arial", 8, "italic"),
-                          foreground="gray").grid(
-                    row=current_row, column=2, sticky=tk.W, pady=2)
-
+            self._make_entity_row(frame, output_entity_var, output_count_var, i == 0).grid(
+                row=current_row, column=0, columnspan=4, sticky=tk.W, pady=2)
             current_row += 1
 
         # NEW: INTERFERON SECTION
         # Separator
-        ttk.Separator(frame, orient=tk.HORIZONTAL).grid(row=current_row, column=0, columnspan=4, sticky="ew", pady=15)
+        ttk.Separator(frame, orient=tk.HORIZONTAL, style="Wide.TSeparator").grid(
+            row=current_row, column=0, columnspan=4, sticky="ew", pady=15)
         current_row += 1
 
         # Interferon header
@@ -5357,19 +5840,85 @@ class EffectEditorDialog:
         # Initially disable interferon fields
         self.on_interferon_enabled_change()
 
-        # Add some padding at bottom
-        ttk.Label(frame, text="").grid(row=current_row, column=0, pady=10)
+        # Bottom padding as a grid minsize - no spacer widget needed
+        frame.grid_rowconfigure(current_row, minsize=20)
+
+        # If the content fits the dialog's content area, skip the canvas
+        # entirely - no embedded window, no scrollregion bookkeeping
+        self.dialog.update_idletasks()
+        needed = scrollable_frame.winfo_reqheight()
+        available = self.content_frame.winfo_height()
+        if available <= 1:
+            # Dialog not mapped yet; estimate from its configured height
+            # less the header/type/button chrome
+            available = 650 - 160
+
+        if needed <= available:
+            scrollable_frame.pack(fill=tk.BOTH, expand=True)
+            return container
+
+        # Oversize: wrap the already-built frame in a scrollable canvas.
+        # No focus highlight border: Tk repaints it on every Configure,
+        # which is pure overdraw for a content canvas that never takes focus
+        canvas = tk.Canvas(container, highlightthickness=0, borderwidth=0,
+                           takefocus=0, yscrollincrement=20)
+        scrollbar = ttk.Scrollbar(container, orient=tk.VERTICAL, command=canvas.yview)
+
+        # <Configure> fires once per child placement; coalesce the
+        # full-subtree bbox recomputes into one per idle pass
+        self._bbox_pending = False
+
+        def _update_scrollregion():
+            self._bbox_pending = False
+            canvas.configure(scrollregion=canvas.bbox("all"))
+
+        def _on_frame_configure(event):
+            if self._bbox_pending:
+                return
+            self._bbox_pending = True
+            canvas.after_idle(_update_scrollregion)
+
+        scrollable_frame.bind("<Configure>", _on_frame_configure)
+
+        # container is an ancestor of the canvas, so the frame can be
+        # embedded without being reparented
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+
+        # Pack scrollbar and canvas
+        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Route mouse-wheel events here via the shared app-wide binding
+        _ensure_wheel_routing(self.dialog)
+        _set_active_scroll_canvas(canvas)
+        self.dialog.bind("<Destroy>", lambda e: _set_active_scroll_canvas(None), add="+")
 
-        # Configure canvas scrolling with mouse wheel
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        return container
 
-        canvas.bind("<MouseWheel>", _on_mousewheel)  # Windows
-        canvas.bind("<Button-4>", lambda e: canvas.yview_scroll(-1, "units"))  # Linux
-        canvas.bind("<Button-5>", lambda e: canvas.yview_scroll(1, "units"))  # Linux
+    def _make_entity_header(self, parent):
+        """Header row matching the column widths of _make_entity_row"""
+        header = ttk.Frame(parent)
+        ttk.Label(header, text="Entity", font=("Arial", 9, "bold"), width=28).pack(side=tk.LEFT)
+        ttk.Label(header, text="Count", font=("Arial", 9, "bold"), width=10).pack(side=tk.LEFT)
+        ttk.Label(header, text="Notes", font=("Arial", 9, "bold")).pack(side=tk.LEFT)
+        return header
 
-        # Set focus to the scrollable area so mouse wheel works
-        canvas.focus_set()
+    def _make_entity_row(self, parent, entity_var, count_var, show_note):
+        """One input/output row as a composite frame.
+
+        The combo, count entry and optional note pack inside the frame, so
+        placing the whole row is a single grid call for the parent's
+        constraint solver instead of one per widget.
+        """
+        row = ttk.Frame(parent)
+        ttk.Combobox(row, textvariable=entity_var, values=self._entity_values,
+                     width=25).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Entry(row, textvariable=count_var, width=8).pack(side=tk.LEFT, padx=(0, 10))
+        if show_note:
+            ttk.Label(row, text="(Leave entity blank to skip row)", font=("Arial", 8, "italic"),
+                      foreground="gray").pack(side=tk.LEFT)
+        return row
 
     def on_interferon_enabled_change(self):
         """Handle interferon enabled checkbox change"""
@@ -5385,8 +5934,9 @@ class EffectEditorDialog:
             self.interferon_help_label.config(foreground=color)
 
     def setup_modify_transition_ui(self):
-        """Setup UI for modify transition effect - UPDATED WITH INTERFERON MULTIPLIER"""
-        frame = ttk.LabelFrame(self.content_frame, text="Modify Transition Rule", padding=10)
+        """Build the modify-transition frame (once) - UPDATED WITH INTERFERON MULTIPLIER"""
+        container = ttk.Frame(self.content_frame)
+        frame = ttk.LabelFrame(container, text="Modify Transition Rule", padding=10)
         frame.pack(fill=tk.BOTH, expand=True)
 
         # Rule to modify
@@ -5417,31 +5967,40 @@ class EffectEditorDialog:
                   font=("Arial", 9, "italic"), foreground="#dc2626").grid(row=5, column=0, columnspan=3, sticky=tk.W,
                                                                           pady=(10, 0))
 
+        return container
+
     def ok_clicked(self):
         """Handle OK button click - UPDATED FOR INTERFERON SUPPORT"""
         effect_type = self.effect_type_var.get()
 
         try:
             if effect_type == "add_transition":
+                # Collect every validation failure so the user sees them in
+                # one dialog instead of a modal per mistake
+                errors = []
+
                 rule_name = self.rule_name_var.get().strip()
                 if not rule_name:
-                    messagebox.showerror("Error", "Rule name is required")
-                    return
+                    errors.append("Rule name is required")
 
                 # Build inputs list (filter out empty entities)
+                # Consumed is all-or-nothing, so read it once outside the loop
+                consumed = self.input_consumed_var.get()
                 inputs = []
+                any_input_specified = False
                 for i in range(3):
                     entity_name = self.input_entity_vars[i].get().strip()
                     if entity_name:  # Only add if entity is specified
+                        any_input_specified = True
                         count = self.input_count_vars[i].get()
                         if count <= 0:
-                            messagebox.showerror("Error", f"Input {i + 1} count must be greater than 0")
-                            return
-                        inputs.append({
-                            "entity": entity_name,
-                            "count": count,
-                            "consumed": self.input_consumed_var.get()
-                        })
+                            errors.append(f"Input {i + 1} count must be greater than 0")
+                        else:
+                            inputs.append({
+                                "entity": entity_name,
+                                "count": count,
+                                "consumed": consumed
+                            })
 
                 # Build outputs list (filter out empty entities)
                 outputs = []
@@ -5450,16 +6009,26 @@ class EffectEditorDialog:
                     if entity_name:  # Only add if entity is specified
                         count = self.output_count_vars[i].get()
                         if count <= 0:
-                            messagebox.showerror("Error", f"Output {i + 1} count must be greater than 0")
-                            return
-                        outputs.append({
-                            "entity": entity_name,
-                            "count": count
-                        })
+                            errors.append(f"Output {i + 1} count must be greater than 0")
+                        else:
+                            outputs.append({
+                                "entity": entity_name,
+                                "count": count
+                            })
 
                 # Validate that we have at least one input
-                if not inputs:
-                    messagebox.showerror("Error", "At least one input entity is required")
+                if not any_input_specified:
+                    errors.append("At least one input entity is required")
+
+                # NEW: Validate interferon amount if enabled
+                interferon_amount = None
+                if self.interferon_enabled_var.get():
+                    interferon_amount = self.interferon_amount_var.get()
+                    if interferon_amount < 0.0 or interferon_amount > 100.0:
+                        errors.append("Interferon amount must be between 0.0 and 100.0")
+
+                if errors:
+                    messagebox.showerror("Error", "\n".join(errors))
                     return
 
                 # Build rule object
@@ -5471,17 +6040,8 @@ class EffectEditorDialog:
                     "rule_type": self.rule_type_var.get()
                 }
 
-                # NEW: Add interferon amount if enabled
-                if self.interferon_enabled_var.get():
-                    interferon_amount = self.interferon_amount_var.get()
-
-                    # Validate interferon amount
-                    if interferon_amount < 0.0 or interferon_amount > 100.0:
-                        messagebox.showerror("Error", "Interferon amount must be between 0.0 and 100.0")
-                        return
-
-                    if interferon_amount > 0.0:  # Only add if actually specified
-                        rule_data["interferon_amount"] = round(interferon_amount, 2)
+                if interferon_amount:  # Only add if actually specified
+                    rule_data["interferon_amount"] = round(interferon_amount, 2)
 
                 self.result = {
                     "type": effect_type,
@@ -5540,13 +6100,33 @@ class GameState:
     - NEW: Tracks milestone progress and achievements per run.
     """
 
+    # Fixed attribute layout: no per-instance __dict__, slightly faster
+    # attribute access in the per-turn paths. Every slot is assigned in
+    # __init__; add new attributes here as well
+    __slots__ = (
+        "ep",
+        "deck", "_deck_set", "installed_genes", "_installed_set", "installs_this_round",
+        "selected_starter_entity", "starting_entity_count",
+        "offer_size",
+        "cycle_limit", "cycles_used", "offer_pending",
+        "db_manager",
+        "_rng",
+        "achieved_milestones", "_achieved_snapshot", "milestones_achieved_this_run",
+        "current_turn", "peak_entity_counts", "cumulative_entity_counts",
+        "_milestone_definitions", "_milestone_index", "_bucket_next", "_milestone_view_cache",
+        "_gene_cost_cache", "_all_genes_sorted",
+        "_entity_class_cache", "_entities_view",
+    )
+
     def __init__(self, *, offer_size: int = 5, seed: int | None = None):
         # Economy
         self.ep: int = 0
 
         # Deck-building
         self.deck: list[str] = []
+        self._deck_set: set[str] = set()  # mirrors self.deck for O(1) membership
         self.installed_genes: list[str] = []
+        self._installed_set: set[str] = set()  # mirrors installed_genes for O(1) membership
         self.installs_this_round: int = 0
 
         # Starter entity selection and count
@@ -5565,32 +6145,55 @@ class GameState:
         self.db_manager = None  # set via set_database_manager()
 
         # RNG
-        import random
         self._rng = random.Random(seed)
 
         # =================== MILESTONE TRACKING ===================
 
         # Milestone achievements for entire playthrough (persistent across play runs)
         self.achieved_milestones: set[str] = set()  # milestone IDs achieved in this playthrough
+        self._achieved_snapshot: frozenset[str] = frozenset()  # stable copy for read paths
 
         # Milestone achievements for current play run only
         self.milestones_achieved_this_run: set[str] = set()  # reset each play run
 
         # Progress tracking for current play run (reset each play run)
         self.current_turn: int = 0
-        self.peak_entity_counts: dict[str, int] = {}  # entity_class -> max count seen
-        self.cumulative_entity_counts: dict[str, int] = {}  # entity_class -> total created
+        self.peak_entity_counts: Counter[str] = Counter()  # entity_class -> max count seen
+        self.cumulative_entity_counts: Counter[str] = Counter()  # entity_class -> total created
+
+        # Milestone definitions (fetched lazily from the database)
+        self._milestone_definitions: dict[str, dict] | None = None
+        self._milestone_index = None  # type-bucketed views of the definitions
+        self._bucket_next: dict[tuple, int] = {}  # per-bucket first-unachieved index
+        self._milestone_view_cache: dict[str, dict] = {}  # reusable display dicts
+
+        # Gene name -> EP cost, built when the database is attached
+        self._gene_cost_cache: dict[str, int] = {}
+        self._all_genes_sorted: tuple[str, ...] = ()
 
-        # Milestone definitions (loaded from database)
-        self._milestone_definitions: dict[str, dict] = {}
+        # Entity name -> entity_class memo (None for unknown entities),
+        # resolved against the manager's live entities mapping
+        self._entity_class_cache: dict[str, str | None] = {}
+        self._entities_view: dict[str, dict] = {}
 
     # ------------ Wiring helpers ------------
     def set_database_manager(self, db_manager):
         self.db_manager = db_manager
         # Auto-select first available starter entity
         self._auto_select_starter_entity()
-        # Load milestone definitions
-        self._load_milestone_definitions()
+        # Milestone definitions are fetched on first use
+        self._milestone_definitions = None
+        self._milestone_index = None
+        self._milestone_view_cache.clear()
+        # Precompute gene costs so affordability checks are one dict lookup
+        self._gene_cost_cache = {
+            name: int(gene.get("cost", 0))
+            for name, gene in db_manager.database["genes"].items()
+        }
+        # Sorted gene catalog, so offer draws don't re-sort per call
+        self._all_genes_sorted = tuple(sorted(db_manager.get_all_genes()))
+        self._entity_class_cache.clear()
+        self._entities_view = db_manager.get_all_entities()
 
     def _auto_select_starter_entity(self):
         """Automatically select the first available starter entity"""
@@ -5606,13 +6209,15 @@ class GameState:
             if all_entities:
                 self.selected_starter_entity = all_entities[0]
 
-    def _load_milestone_definitions(self):
-        """Load milestone definitions from database"""
-        if not self.db_manager:
-            self._milestone_definitions = {}
-            return
-
-        self._milestone_definitions = self.db_manager.get_milestones()
+    @property
+    def milestone_definitions(self) -> dict[str, dict]:
+        """Milestone definitions, fetched from the database on first access"""
+        if self._milestone_definitions is None:
+            if self.db_manager:
+                self._milestone_definitions = self.db_manager.get_milestones()
+            else:
+                self._milestone_definitions = {}
+        return self._milestone_definitions
 
     # ------------ Starter entity helpers ------------
     def get_available_starter_entities(self) -> list[str]:
@@ -5646,19 +6251,14 @@ class GameState:
             return False, "No starter entities defined in database"
 
         if self.selected_starter_entity not in available_starters:
-            # Try to auto-fix
-            self._auto_select_starter_entity()
-            if self.selected_starter_entity not in available_starters:
-                return False, f"Selected starter entity '{self.selected_starter_entity}' is not available"
+            # Auto-fix from the list we already fetched
+            self.selected_starter_entity = available_starters[0]
 
         return True, "Valid starter entity selected"
 
     # ------------ Cost helpers ------------
     def get_gene_cost(self, gene_name: str) -> int:
-        if not self.db_manager:
-            return 0
-        gene = self.db_manager.get_gene(gene_name)
-        return int(gene.get("cost", 0)) if gene else 0
+        return self._gene_cost_cache.get(gene_name, 0)
 
     # ------------ EP Management (spending only, awards only for milestones) ------------
 
@@ -5696,29 +6296,39 @@ class GameState:
 
     # ------------ Deck helpers ------------
     def add_to_deck(self, gene_name: str) -> bool:
-        if gene_name not in self.deck:
+        if gene_name not in self._deck_set:
+            self._deck_set.add(gene_name)
             self.deck.append(gene_name)
             return True
         return False
 
     def in_deck(self, gene_name: str) -> bool:
-        return gene_name in self.deck
+        return gene_name in self._deck_set
 
-    # ------------ Offer helpers ------------
-    def _all_gene_names(self) -> list[str]:
-        if not self.db_manager:
-            return []
-        return list(self.db_manager.get_all_genes())
+    def track_installed_gene(self, gene_name: str):
+        """Track an installed gene (deck-building record)"""
+        if gene_name not in self._installed_set:
+            self._installed_set.add(gene_name)
+            self.installed_genes.append(gene_name)
 
+    def untrack_installed_gene(self, gene_name: str):
+        """Drop a gene from the installed record, if present"""
+        if gene_name in self._installed_set:
+            self._installed_set.discard(gene_name)
+            self.installed_genes.remove(gene_name)
+
+    # ------------ Offer helpers ------------
     def draw_gene_offers(self, n: int | None = None, exclude: set[str] | None = None) -> list[str]:
         n = n or self.offer_size
         exclude = exclude or set()
-        pool = set(self._all_gene_names()) - set(self.deck) - set(exclude)
-        pool_list = sorted(pool)
-        if not pool_list:
+        # The catalog tuple is pre-sorted, so one filtering pass keeps the
+        # deterministic pool order without a per-call sort
+        deck = self._deck_set
+        pool = [g for g in self._all_genes_sorted if g not in deck and g not in exclude]
+        if not pool:
             return []
-        k = min(n, len(pool_list))
-        return self._rng.sample(pool_list, k)
+        k = min(n, len(pool))
+        return self._rng.sample(pool, k)
 
     # =================== MILESTONE SYSTEM ===================
 
@@ -5733,6 +6343,8 @@ class GameState:
     def reset_for_new_game(self):
         """Reset all milestone data for a completely new game/playthrough"""
         self.achieved_milestones.clear()
+        self._bucket_next.clear()
+        self._achieved_snapshot = frozenset()
         self.reset_milestone_progress()
 
     def update_turn_count(self, turn_number: int):
@@ -5752,65 +6364,125 @@ class GameState:
             return
 
         # Group current entities by class for peak tracking
-        current_by_class = {}
+        current_by_class = Counter()
         for entity_name, count in current_entities.items():
-            entity_data = self.db_manager.get_entity(entity_name)
-            if entity_data:
-                entity_class = entity_data.get("entity_class", "unknown")
-                current_by_class[entity_class] = current_by_class.get(entity_class, 0) + count
+            entity_class = self._class_of(entity_name)
+            if entity_class:
+                current_by_class[entity_class] += count
 
-        # Update peak counts
+        # Update peak counts, remembering which classes actually advanced
+        peaks = self.peak_entity_counts
+        changed_peaks = {}
         for entity_class, count in current_by_class.items():
-            self.peak_entity_counts[entity_class] = max(
-                self.peak_entity_counts.get(entity_class, 0),
-                count
-            )
+            if count > peaks[entity_class]:
+                peaks[entity_class] = count
+                changed_peaks[entity_class] = count
 
         # Update cumulative counts if entities were created
+        changed_cumulative = {}
         if entities_created_this_turn:
+            created_by_class = Counter()
             for entity_name, count in entities_created_this_turn.items():
-                entity_data = self.db_manager.get_entity(entity_name)
-                if entity_data:
-                    entity_class = entity_data.get("entity_class", "unknown")
-                    self.cumulative_entity_counts[entity_class] = (
-                            self.cumulative_entity_counts.get(entity_class, 0) + count
-                    )
-
-        # Check for newly achieved milestones
-        self._check_entity_count_milestones()
+                entity_class = self._class_of(entity_name)
+                if entity_class:
+                    created_by_class[entity_class] += count
+            self.cumulative_entity_counts.update(created_by_class)
+            cumulative = self.cumulative_entity_counts
+            changed_cumulative = {cls: cumulative[cls] for cls in created_by_class}
+
+        # Check milestones only for the counters that moved this turn
+        if changed_peaks or changed_cumulative:
+            self._check_entity_count_milestones(changed_peaks, changed_cumulative)
+
+    def _mark_achieved(self, milestone_id: str):
+        """Record a milestone as achieved (this run and playthrough-wide)"""
+        self.milestones_achieved_this_run.add(milestone_id)
+        self.achieved_milestones.add(milestone_id)
+        self._achieved_snapshot = frozenset(self.achieved_milestones)
+
+    def get_achieved(self) -> frozenset[str]:
+        """Stable snapshot of playthrough achievements (safe to hold across turns)"""
+        return self._achieved_snapshot
+
+    def _class_of(self, entity_name: str) -> str | None:
+        """Memoized entity name -> entity_class lookup (None if unknown)"""
+        try:
+            return self._entity_class_cache[entity_name]
+        except KeyError:
+            entity_data = self._entities_view.get(entity_name)
+            entity_class = entity_data.get("entity_class", "unknown") if entity_data else None
+            self._entity_class_cache[entity_name] = entity_class
+            return entity_class
+
+    def _ensure_milestone_index(self):
+        """Type-bucketed (target, id) lists so per-turn checks only scan
+        the relevant milestones, in ascending target order"""
+        if self._milestone_index is None:
+            survive = []
+            peak_by_class = {}
+            cumulative_by_class = {}
+            for milestone_id, milestone in self.milestone_definitions.items():
+                milestone_type = milestone["type"]
+                entry = (milestone["target"], milestone_id)
+                entity_class = milestone.get("entity_class")
+                if milestone_type == "survive_turns":
+                    survive.append(entry)
+                elif milestone_type == "peak_entity_count" and entity_class:
+                    peak_by_class.setdefault(entity_class, []).append(entry)
+                elif milestone_type == "cumulative_entity_count" and entity_class:
+                    cumulative_by_class.setdefault(entity_class, []).append(entry)
+            survive.sort()
+            for bucket in peak_by_class.values():
+                bucket.sort()
+            for bucket in cumulative_by_class.values():
+                bucket.sort()
+            self._milestone_index = (survive, peak_by_class, cumulative_by_class)
+            self._bucket_next.clear()
+        return self._milestone_index
+
+    def _scan_reached(self, key, bucket, current):
+        """Mark every not-yet-achieved milestone in a sorted (target, id)
+        bucket whose target the current value has reached.
+
+        A per-bucket cursor remembers the first unachieved entry so
+        already-awarded thresholds are never re-examined; bisect then
+        bounds the newly reached span, so a turn that crosses no
+        threshold costs one comparison.
+        """
+        start = self._bucket_next.get(key, 0)
+        if start >= len(bucket) or bucket[start][0] > current:
+            return
+        hi = bisect.bisect_right(bucket, current, lo=start,
+                                 key=lambda entry: entry[0])
+        for target, milestone_id in bucket[start:hi]:
+            if milestone_id not in self.achieved_milestones:
+                self._mark_achieved(milestone_id)
+        # Everything before hi is now achieved; resume there next time
+        self._bucket_next[key] = hi
 
     def _check_survival_milestones(self):
         """Check if any survival milestones have been achieved in this run"""
-        for milestone_id, milestone in self._milestone_definitions.items():
-            if (milestone["type"] == "survive_turns"
-                    and milestone_id not in self.achieved_milestones  # Not already achieved in playthrough
-                    and milestone_id not in self.milestones_achieved_this_run):  # Not already achieved this run
-                if self.current_turn >= milestone["target"]:
-                    self.milestones_achieved_this_run.add(milestone_id)
-                    self.achieved_milestones.add(milestone_id)
-
-    def _check_entity_count_milestones(self):
-        """Check if any entity count milestones have been achieved in this run"""
-        for milestone_id, milestone in self._milestone_definitions.items():
-            if (milestone_id in self.achieved_milestones  # Already achieved in playthrough
-                    or milestone_id in self.milestones_achieved_this_run):  # Already achieved this run
-                continue
-
-            milestone_type = milestone["type"]
-            target = milestone["target"]
-            entity_class = milestone.get("entity_class")
-
-            if milestone_type == "peak_entity_count" and entity_class:
-                current_peak = self.peak_entity_counts.get(entity_class, 0)
-                if current_peak >= target:
-                    self.milestones_achieved_this_run.add(milestone_id)
-                    self.achieved_milestones.add(milestone_id)
-
-            elif milestone_type == "cumulative_entity_count" and entity_class:
-                current_cumulative = self.cumulative_entity_counts.get(entity_class, 0)
-                if current_cumulative >= target:
-                    self.milestones_achieved_this_run.add(milestone_id)
-                    self.achieved_milestones.add(milestone_id)
+        survive, _, _ = self._ensure_milestone_index()
+        self._scan_reached(("survive",), survive, self.current_turn)
+
+    def _check_entity_count_milestones(self, changed_peaks=None, changed_cumulative=None):
+        """Check entity count milestones; restricted to the given
+        class -> value maps when provided, else the full counters"""
+        _, peak_by_class, cumulative_by_class = self._ensure_milestone_index()
+        if changed_peaks is None:
+            changed_peaks = self.peak_entity_counts
+        if changed_cumulative is None:
+            changed_cumulative = self.cumulative_entity_counts
+
+        for entity_class, current_peak in changed_peaks.items():
+            bucket = peak_by_class.get(entity_class)
+            if bucket:
+                self._scan_reached(("peak", entity_class), bucket, current_peak)
+
+        for entity_class, current_cumulative in changed_cumulative.items():
+            bucket = cumulative_by_class.get(entity_class)
+            if bucket:
+                self._scan_reached(("cumulative", entity_class), bucket, current_cumulative)
 
     def get_milestone_progress(self) -> dict[str, dict]:
         """
@@ -5822,36 +6494,51 @@ class GameState:
                 "achieved": [list of achieved milestone data],
                 "open": [list of open milestone data with progress],
                 "total_ep_earned": int,
-                "newly_achieved_this_run": [list of milestones achieved in current run]
+                "newly_achieved_this_run": [list of milestones achieved in current run],
+                "newly_achieved_ep_total": int
             }
         """
         achieved = []
         open_milestones = []
         newly_achieved_this_run = []
         total_ep_earned = 0
-
-        for milestone_id, milestone in self._milestone_definitions.items():
-            milestone_data = milestone.copy()
-            milestone_data["achieved"] = milestone_id in self.achieved_milestones
-            milestone_data["achieved_this_run"] = milestone_id in self.milestones_achieved_this_run
-
-            if milestone_data["achieved"]:
+        newly_achieved_ep_total = 0
+
+        # Display dicts are copied once per milestone and reused across
+        # calls; only the volatile fields are rewritten on each poll.
+        # Everything touched per iteration is bound to a local first
+        views = self._milestone_view_cache
+        achieved_set = self.achieved_milestones
+        this_run_set = self.milestones_achieved_this_run
+        progress_info_for = self._get_milestone_progress_info
+        for milestone_id, milestone in self.milestone_definitions.items():
+            milestone_data = views.get(milestone_id)
+            if milestone_data is None:
+                milestone_data = views[milestone_id] = milestone.copy()
+            is_achieved = milestone_id in achieved_set
+            this_run = milestone_id in this_run_set
+            milestone_data["achieved"] = is_achieved
+            milestone_data["achieved_this_run"] = this_run
+
+            if is_achieved:
                 achieved.append(milestone_data)
-                total_ep_earned += milestone["reward_ep"]
+                reward = milestone["reward_ep"]
+                total_ep_earned += reward
 
-                if milestone_data["achieved_this_run"]:
+                if this_run:
                     newly_achieved_this_run.append(milestone_data)
+                    newly_achieved_ep_total += reward
             else:
                 # Add progress information for open milestones
-                progress_info = self._get_milestone_progress_info(milestone)
-                milestone_data.update(progress_info)
+                milestone_data.update(progress_info_for(milestone))
                 open_milestones.append(milestone_data)
 
         return {
             "achieved": achieved,
             "open": open_milestones,
             "total_ep_earned": total_ep_earned,
-            "newly_achieved_this_run": newly_achieved_this_run
+            "newly_achieved_this_run": newly_achieved_this_run,
+            "newly_achieved_ep_total": newly_achieved_ep_total
         }
 
     def _get_milestone_progress_info(self, milestone: dict) -> dict:
@@ -5904,7 +6591,7 @@ class GameState:
 
         # Only process milestones achieved in this run
         for milestone_id in self.milestones_achieved_this_run:
-            milestone = self._milestone_definitions.get(milestone_id)
+            milestone = self.milestone_definitions.get(milestone_id)
             if milestone:
                 # Award EP
                 reward_ep = milestone["reward_ep"]
@@ -5917,29 +6604,39 @@ class GameState:
 
         return newly_achieved
 
-    def get_available_milestones(self) -> list[dict]:
-        """Get all milestone definitions from database"""
-        return list(self._milestone_definitions.values())
+    def get_available_milestones(self):
+        """All milestone definitions from the database (dict view, not a copy)"""
+        return self.milestone_definitions.values()
 
     def refresh_milestone_definitions(self):
-        """Refresh milestone definitions from database (call after database changes)"""
-        self._load_milestone_definitions()
+        """Drop cached milestone definitions (call after database changes)"""
+        self._milestone_definitions = None
+        self._milestone_index = None
+        self._milestone_view_cache.clear()
+        if self.db_manager:
+            self._gene_cost_cache = {
+                name: int(gene.get("cost", 0))
+                for name, gene in self.db_manager.database["genes"].items()
+            }
+            self._all_genes_sorted = tuple(sorted(self.db_manager.get_all_genes()))
+            self._entities_view = self.db_manager.get_all_entities()
+        self._entity_class_cache.clear()
 
     def has_milestones_achieved_this_run(self) -> bool:
         """Check if any milestones were achieved in the current run"""
-        return len(self.milestones_achieved_this_run) > 0
+        return bool(self.milestones_achieved_this_run)
 
-    def get_milestones_achieved_this_run(self) -> list[dict]:
-        """Get list of milestones achieved in this specific run"""
-        achieved_this_run = []
+    def get_milestones_achieved_this_run(self):
+        """Yield milestones achieved in this specific run, lazily; wrap in
+        list() at the call site when indexing is needed"""
+        definitions = self.milestone_definitions
         for milestone_id in self.milestones_achieved_this_run:
-            milestone = self._milestone_definitions.get(milestone_id)
+            milestone = definitions.get(milestone_id)
             if milestone:
                 milestone_copy = milestone.copy()
                 milestone_copy["achieved"] = True
                 milestone_copy["achieved_this_run"] = True
-                achieved_this_run.append(milestone_copy)
-        return achieved_this_run
+                yield milestone_copy
 
     def increase_starting_entity_count(self, amount: int = 2):
         """Increase starting entity count (called when skipping gene offers)"""
@@ -5972,6 +6669,10 @@ class VirusSandboxController:
         self.root.geometry("1200x800")
         self.root.minsize(900, 700)
 
+        # Screen size is fixed for the process lifetime; caching it lets
+        # dialog centering skip two winfo round-trips per open
+        self.screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+
         # Initialize modules
         self.modules = {}
         self.current_module = None
@@ -5980,6 +6681,13 @@ class VirusSandboxController:
         # Persistent game state
         self.game_state = None
 
+        # Gene-offer dialog pool: built once on first offer, then hidden
+        # and repopulated instead of rebuilt
+        self._offer_widgets = None
+        self._offer_list = []
+        self._offer_choice = None
+        self._offer_done = None
+
         self.setup_modules()
         self.switch_to_module("menu")
 
@@ -6004,19 +6712,89 @@ class VirusSandboxController:
 
         # When returning FROM Play TO Builder, show the pending gene offer (if any)
         # NOTE: Milestone notifications and EP awards are handled by PlayModule.exit_to_builder() before this
-        if prev == "play" and module_name == "builder" and self.game_state:
-            self.game_state.reset_round_install_counter()
-            if self.game_state.offer_pending:
+        gs = self.game_state
+        if prev == "play" and module_name == "builder" and gs:
+            gs.reset_round_install_counter()
+            if gs.offer_pending:
                 try:
                     self._show_gene_offer_dialog()
                 finally:
-                    self.game_state.offer_pending = False
+                    gs.offer_pending = False  # ensure it's cleared even if dialog closed
 
-        if prev == "play" and module_name == "builder" and self.game_state and self.game_state.offer_pending:
-            try:
-                self._show_gene_offer_dialog()
-            finally:
-                self.game_state.offer_pending = False  # ensure it's cleared even if dialog closed
+    def _ensure_offer_dialog(self):
+        """Build the gene-offer dialog widgets once and keep them hidden
+        between offers; repopulating is far cheaper than rebuilding the
+        whole Toplevel every time"""
+        if self._offer_widgets is not None:
+            return self._offer_widgets
+
+        dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
+        dialog.title("Evolutionary Opportunity")
+        dialog.transient(self.root)
+
+        # Center the dialog from the cached screen size
+        x = (self.screen_size[0] // 2) - (230)  # Half of dialog width (460/2)
+        y = (self.screen_size[1] // 2) - (180)  # Half of dialog height (360/2)
+        dialog.geometry(f"460x360+{x}+{y}")  # Slightly larger to accommodate bonus info
+
+        # Header with better styling
+        header_frame = ttk.Frame(dialog)
+        header_frame.pack(fill=tk.X, padx=20, pady=20)
+
+        ttk.Label(header_frame, text="Evolutionary Opportunity", font=("Arial", 14, "bold")).pack()
+        ttk.Label(header_frame, text="Select ONE new gene to add to your deck:",
+                  font=("Arial", 11)).pack(pady=(10, 0))
+
+        # Gene selection area
+        selection_frame = ttk.Frame(dialog)
+        selection_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 10))
+
+        listbox = tk.Listbox(selection_frame, font=("Arial", 10))
+        listbox.pack(fill=tk.BOTH, expand=True)
+
+        # NEW: Starting count bonus info (packed only when a bonus applies)
+        bonus_frame = ttk.Frame(dialog)
+        bonus_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
+        bonus_label = ttk.Label(bonus_frame, font=("Arial", 10, "italic"), foreground="blue")
+
+        # Button area
+        button_frame = ttk.Frame(dialog)
+        button_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
+
+        ttk.Button(button_frame, text="Add Selected Gene", command=self._offer_choose).pack(side=tk.LEFT, padx=(0, 10))
+
+        # NEW: Skip button with bonus indication
+        ttk.Button(button_frame, text="Skip (+2 starting entities)",
+                   command=self._offer_skip).pack(side=tk.LEFT)
+
+        # Keyboard handling and window close
+        dialog.bind('<Escape>', lambda e: self._close_offer_dialog())
+        dialog.bind('<Return>', lambda e: self._offer_choose())
+        dialog.protocol("WM_DELETE_WINDOW", self._close_offer_dialog)
+
+        self._offer_done = tk.BooleanVar(master=self.root, value=False)
+        self._offer_widgets = {"dialog": dialog, "listbox": listbox, "bonus_label": bonus_label}
+        return self._offer_widgets
+
+    def _offer_choose(self):
+        """Accept the selected offer (if any) and close the dialog"""
+        sel = self._offer_widgets["listbox"].curselection()
+        if sel:
+            self._offer_choice = self._offer_list[sel[0]]
+        self._close_offer_dialog()
+
+    def _offer_skip(self):
+        """Skip gene selection and get starting entity bonus"""
+        self.game_state.increase_starting_entity_count(2)
+        self._close_offer_dialog()
+
+    def _close_offer_dialog(self):
+        """Hide the pooled dialog and release the modal wait"""
+        dialog = self._offer_widgets["dialog"]
+        dialog.grab_release()
+        dialog.withdraw()
+        self._offer_done.set(True)
 
     def start_new_game_with_database(self, database_manager):
         """Start new game with a loaded database - WITH MILESTONE INITIALIZATION"""
@@ -6035,11 +6813,12 @@ class VirusSandboxController:
         # NEW: Reset starting entity count for new game
         self.game_state.reset_starting_entity_count()
 
-        # Seed deck with 10 random genes
-        import random
+        # Seed deck with 10 random genes, drawn from the game RNG so a
+        # seeded GameState produces the same starting deck
         all_genes = database_manager.get_all_genes()
         initial_deck_size = min(10, len(all_genes))
-        self.game_state.deck = random.sample(all_genes, initial_deck_size)
+        self.game_state.deck = self.game_state._rng.sample(all_genes, initial_deck_size)
+        self.game_state._deck_set = set(self.game_state.deck)
         self.game_state.ep = 100  # starting EP
 
         # Wire modules
@@ -6117,96 +6896,59 @@ class VirusSandboxController:
             return
 
         # Build exclusion: already in deck or currently installed
-        exclude = set(self.game_state.deck) | set(self.game_state.installed_genes)
-
-        import random
-        all_genes = list(self.current_database_manager.get_all_genes())
-        pool = [g for g in all_genes if g not in exclude]
-        if not pool:
+        gs = self.game_state
+        exclude = gs._deck_set | gs._installed_set
+
+        # C-level frozenset difference replaces the per-gene Python filter;
+        # the pool is sorted before sampling so seeded runs stay
+        # reproducible regardless of hash ordering
+        pool_set = self.current_database_manager.get_all_genes_set() - exclude
+        if not pool_set:
             messagebox.showinfo("Gene Offer", "No new genes are available.")
             return
 
-        k = min(self.game_state.offer_size, len(pool))
-        offers = random.sample(pool, k)
-
-        # Modal dialog - IMPROVED CENTERING
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Evolutionary Opportunity")
-        dialog.geometry("460x360")  # Slightly larger to accommodate bonus info
-        dialog.transient(self.root)
-        dialog.grab_set()
-
-        # Center the dialog properly
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (230)  # Half of dialog width (460/2)
-        y = (dialog.winfo_screenheight() // 2) - (180)  # Half of dialog height (360/2)
-        dialog.geometry(f"460x360+{x}+{y}")
-
-        # Header with better styling
-        header_frame = ttk.Frame(dialog)
-        header_frame.pack(fill=tk.X, padx=20, pady=20)
+        k = min(gs.offer_size, len(pool_set))
+        offers = gs._rng.sample(sorted(pool_set), k)
 
-        ttk.Label(header_frame, text="Evolutionary Opportunity", font=("Arial", 14, "bold")).pack()
-        ttk.Label(header_frame, text="Select ONE new gene to add to your deck:",
-                  font=("Arial", 11)).pack(pady=(10, 0))
+        # Pooled modal dialog: built once, repopulated per offer
+        widgets = self._ensure_offer_dialog()
+        dialog = widgets["dialog"]
+        listbox = widgets["listbox"]
+        bonus_label = widgets["bonus_label"]
 
-        # Gene selection area
-        selection_frame = ttk.Frame(dialog)
-        selection_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 10))
+        self._offer_list = offers
+        self._offer_choice = None
 
-        listbox = tk.Listbox(selection_frame, height=min(10, len(offers)), font=("Arial", 10))
+        # Rows mirror `offers`, so the selection index recovers the gene
+        # name without parsing it back out of the display text
+        get_gene = self.current_database_manager.get_gene
+        rows = []
         for name in offers:
-            cost = 0
-            gene = self.current_database_manager.get_gene(name)
-            if gene:
-                cost = gene.get("cost", 0)
-            listbox.insert(tk.END, f"{name} ({cost} EP)")
-        listbox.pack(fill=tk.BOTH, expand=True)
+            gene = get_gene(name)
+            cost = gene.get("cost", 0) if gene else 0
+            rows.append(f"{name} ({cost} EP)")
+        listbox.delete(0, tk.END)
+        listbox.insert(tk.END, *rows)
+        listbox.configure(height=min(10, len(offers)))
 
         # NEW: Starting count bonus info
-        bonus_frame = ttk.Frame(dialog)
-        bonus_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
-
-        current_count = self.game_state.get_starting_entity_count()
+        current_count = gs.get_starting_entity_count()
         if current_count > 10:
-            bonus_text = f"Current starting entities: {current_count} (bonus: +{current_count - 10})"
-            ttk.Label(bonus_frame, text=bonus_text, font=("Arial", 10, "italic"),
-                      foreground="blue").pack()
-
-        selection_holder = {"choice": None}
-
-        def choose_and_close():
-            sel = listbox.curselection()
-            if sel:
-                display = listbox.get(sel[0])
-                gene_name = display.split(" (")[0]
-                selection_holder["choice"] = gene_name
-            dialog.destroy()
-
-        def skip_and_get_bonus():
-            """Skip gene selection and get starting entity bonus"""
-            self.game_state.increase_starting_entity_count(2)
-            dialog.destroy()
-
-        # Button area
-        button_frame = ttk.Frame(dialog)
-        button_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
-
-        ttk.Button(button_frame, text="Add Selected Gene", command=choose_and_close).pack(side=tk.LEFT, padx=(0, 10))
-
-        # NEW: Skip button with bonus indication
-        skip_text = f"Skip (+2 starting entities)"
-        ttk.Button(button_frame, text=skip_text, command=skip_and_get_bonus).pack(side=tk.LEFT)
+            bonus_label.config(
+                text=f"Current starting entities: {current_count} (bonus: +{current_count - 10})")
+            bonus_label.pack()
+        else:
+            bonus_label.pack_forget()
 
-        # Focus and keyboard handling
+        # Show modally; _close_offer_dialog withdraws the window and
+        # flips the wait variable instead of destroying anything
+        self._offer_done.set(False)
+        dialog.deiconify()
+        dialog.grab_set()
         dialog.focus_set()
-        dialog.bind('<Escape>', lambda e: dialog.destroy())
-        dialog.bind('<Return>', lambda e: choose_and_close())
-
-        # CRITICAL: Wait for dialog to close (this was already there, but keeping it clear)
-        self.root.wait_window(dialog)
+        self.root.wait_variable(self._offer_done)
 
-        picked = selection_holder["choice"]
+        picked = self._offer_choice
         if picked:
             if self.game_state.add_to_deck(picked):
                 messagebox.showinfo("Gene Added", f"Added to deck: {picked}")